@@ -3,7 +3,7 @@ import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import statistics
-from src.services.nlp_analyzer import NLPAnalyzer
+from src.services.nlp_analyzer import get_analyzer
 from src.services.interview_simulator import InterviewSimulator
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,7 @@ class AssessmentEngine:
     """
     
     def __init__(self):
-        self.nlp_analyzer = NLPAnalyzer()
+        self.nlp_analyzer = get_analyzer()
         self.interview_simulator = InterviewSimulator()
         
         # Assessment weights for different components
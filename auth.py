@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Optional
@@ -8,9 +9,9 @@ from passlib.context import CryptContext
 
 from app.db.session import get_db
 from app.models.database import User
-from app.models.schemas import UserCreate, User as UserSchema, Token, UserRole
+from app.models.schemas import UserCreate, User as UserSchema, Token, UserRole, from_orm_fast
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Security configuration
 SECRET_KEY = "your-secret-key-here"  # In production, use environment variable
@@ -112,7 +113,7 @@ def create_user(db: Session, user: UserCreate) -> User:
 @router.post("/register", response_model=UserSchema)
 async def register(user: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
-    return create_user(db, user)
+    return from_orm_fast(UserSchema, create_user(db, user))
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
@@ -136,7 +137,7 @@ async def login_for_access_token(
 @router.get("/me", response_model=UserSchema)
 async def read_users_me(current_user: User = Depends(get_current_active_user)):
     """Get current user information."""
-    return current_user
+    return from_orm_fast(UserSchema, current_user)
 
 @router.get("/users/{user_id}", response_model=UserSchema)
 async def read_user(
@@ -154,5 +155,5 @@ async def read_user(
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return from_orm_fast(UserSchema, user)
 
@@ -1,17 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 import jwt
 from pydantic import BaseModel, EmailStr, validator
 import re
 
 from app.db.session import get_db
-from app.models.user_models import User, Student, Admin
+from app.models.user_models import User, Student, Admin, Assessment
 from app.models.schemas import Token
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 # JWT Configuration
@@ -54,6 +56,12 @@ class PasswordChangeRequest(BaseModel):
             raise ValueError('Passwords do not match')
         return v
 
+class AssessmentBatchCreateRequest(BaseModel):
+    student_ids: List[int]
+    job_title: str
+    company: str
+    job_description: str
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
@@ -272,6 +280,138 @@ async def change_student_password(
     
     return {"message": "Password changed successfully"}
 
+@router.post("/admin/students/batch", response_model=dict)
+def register_students_batch(
+    students_data: List[StudentRegisterRequest],
+    token_data: dict = Depends(verify_token),
+    db: Session = Depends(get_db)
+):
+    """Register a batch of students (admin onboarding)"""
+    if token_data.get("role") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can use this endpoint"
+        )
+    
+    # Check all emails and mobile numbers in one query each
+    emails = [student.email for student in students_data]
+    mobile_numbers = [student.mobile_number for student in students_data]
+    if len(set(emails)) != len(emails) or len(set(mobile_numbers)) != len(mobile_numbers):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate email or mobile number in batch"
+        )
+    if db.query(User.id).filter(User.email.in_(emails)).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    if db.query(Student.id).filter(Student.mobile_number.in_(mobile_numbers)).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Mobile number already registered"
+        )
+    
+    # Mobile number is the initial password; hash the whole batch in parallel
+    hashed_passwords = User.hash_passwords(mobile_numbers)
+    
+    new_users = [
+        User(
+            email=student.email,
+            hashed_password=hashed_password,
+            is_student=True,
+            is_active=True
+        )
+        for student, hashed_password in zip(students_data, hashed_passwords)
+    ]
+    try:
+        db.add_all(new_users)
+        db.flush()  # Get the user IDs
+        
+        db.add_all([
+            Student(
+                user_id=new_user.id,
+                full_name=student.full_name,
+                mobile_number=student.mobile_number,
+                student_id=student.student_id,
+                course=student.course,
+                year_of_study=student.year_of_study,
+                college=student.college,
+                first_login=True
+            )
+            for student, new_user in zip(students_data, new_users)
+        ])
+        db.commit()
+    except IntegrityError:
+        # Another request registered one of these emails/numbers meanwhile
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email or mobile number already registered"
+        )
+    
+    return {
+        "message": "Students registered successfully",
+        "count": len(new_users),
+        "initial_password": "Your mobile number"
+    }
+
+@router.post("/admin/assessments/batch")
+def create_assessments_batch(
+    batch_data: AssessmentBatchCreateRequest,
+    token_data: dict = Depends(verify_token),
+    db: Session = Depends(get_db)
+):
+    """Assign one job description to a batch of students"""
+    if token_data.get("role") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can use this endpoint"
+        )
+    
+    # Check all students exist in one query
+    requested_ids = set(batch_data.student_ids)
+    if len(requested_ids) != len(batch_data.student_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate student id in batch"
+        )
+    found_ids = {
+        student_id for (student_id,) in
+        db.query(Student.id).filter(Student.id.in_(requested_ids))
+    }
+    missing_ids = sorted(requested_ids - found_ids)
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Students not found: {missing_ids}"
+        )
+    
+    # One multi-row INSERT for the whole batch
+    try:
+        assessment_ids = Assessment.bulk_create(
+            db,
+            admin_id=token_data["admin_id"],
+            student_ids=batch_data.student_ids,
+            job_title=batch_data.job_title,
+            company=batch_data.company,
+            job_description=batch_data.job_description
+        )
+        db.commit()
+    except IntegrityError:
+        # A student was removed between the check and the insert
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not create assessments for the given students"
+        )
+    
+    return {
+        "message": "Assessments created successfully",
+        "count": len(assessment_ids),
+        "assessment_ids": assessment_ids
+    }
+
 @router.get("/me")
 async def get_current_user(
     token_data: dict = Depends(verify_token),
@@ -1,12 +1,66 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Boolean, JSON, LargeBinary, event, inspect, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
 import json
+import zlib
+import threading
+
+try:
+    import zstandard
+except ImportError:  # optional; zlib is used instead
+    zstandard = None
 
 Base = declarative_base()
 
+# Native JSON column: JSONB on PostgreSQL, the dialect's JSON type elsewhere.
+# The driver hands back decoded values, so no json.loads per row in Python.
+JSONColumn = JSON().with_variant(JSONB(), "postgresql")
+
+# Every zstd frame starts with this magic number; anything else is zlib
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+_COMPRESSION_LEVEL = 6
+_zstd_local = threading.local()
+
+def _compress_text(value: str) -> bytes:
+    data = value.encode('utf-8')
+    if zstandard is None:
+        return zlib.compress(data, _COMPRESSION_LEVEL)
+    # zstd contexts are not thread-safe; keep one per thread
+    compressor = getattr(_zstd_local, 'compressor', None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=_COMPRESSION_LEVEL)
+    return compressor.compress(data)
+
+def _decompress_text(value: bytes) -> str:
+    if value[:4] != _ZSTD_MAGIC:
+        return zlib.decompress(value).decode('utf-8')
+    if zstandard is None:
+        raise RuntimeError("zstandard is required to read zstd-compressed text")
+    decompressor = getattr(_zstd_local, 'decompressor', None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(value).decode('utf-8')
+
+class CompressedText(TypeDecorator):
+    """Text stored compressed in a binary column (BYTEA on PostgreSQL)."""
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        return None if value is None else _compress_text(value)
+    
+    def process_result_value(self, value, dialect):
+        return None if value is None else _decompress_text(value)
+
+def _isoformat(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 class User(Base):
     __tablename__ = "users"
     
@@ -32,12 +86,14 @@ class Candidate(Base):
     email = Column(String(120), nullable=False, index=True)
     phone = Column(String(20), nullable=True)
     resume_filename = Column(String(255), nullable=False)
-    resume_text = Column(Text, nullable=True)
-    
-    # Extracted information (stored as JSON strings)
-    extracted_skills = Column(Text, nullable=True)
-    extracted_experience = Column(Text, nullable=True)
-    extracted_education = Column(Text, nullable=True)
+    # Compressed on write; deferred, so it is only fetched and decompressed
+    # when an endpoint actually reads it
+    resume_text = deferred(Column("resume_text_zst", CompressedText, nullable=True))
+    
+    # Extracted information (native JSON)
+    extracted_skills = Column(JSONColumn, nullable=True)
+    extracted_experience = Column(JSONColumn, nullable=True)
+    extracted_education = Column(JSONColumn, nullable=True)
     contact_information = Column(Text, nullable=True)
     
     # Metadata
@@ -50,22 +106,22 @@ class Candidate(Base):
     assessments = relationship("Assessment", back_populates="candidate", cascade="all, delete-orphan")
     
     def get_extracted_skills(self):
-        return json.loads(self.extracted_skills) if self.extracted_skills else {}
+        return self.extracted_skills or {}
     
     def set_extracted_skills(self, skills_dict):
-        self.extracted_skills = json.dumps(skills_dict)
+        self.extracted_skills = skills_dict
     
     def get_extracted_experience(self):
-        return json.loads(self.extracted_experience) if self.extracted_experience else {}
+        return self.extracted_experience or {}
     
     def set_extracted_experience(self, experience_dict):
-        self.extracted_experience = json.dumps(experience_dict)
+        self.extracted_experience = experience_dict
     
     def get_extracted_education(self):
-        return json.loads(self.extracted_education) if self.extracted_education else {}
+        return self.extracted_education or {}
     
     def set_extracted_education(self, education_dict):
-        self.extracted_education = json.dumps(education_dict)
+        self.extracted_education = education_dict
 
 class JobDescription(Base):
     __tablename__ = "job_descriptions"
@@ -136,6 +192,10 @@ class Assessment(Base):
     interview_questions = Column(Text, nullable=True)
     interview_responses = Column(Text, nullable=True)
     
+    # Serialized summary payload, precomputed when the assessment completes;
+    # cleared whenever a field it was built from changes
+    summary_json = Column(Text, nullable=True)
+    
     # Status and metadata
     status = Column(String(50), default="pending")  # pending, in_progress, completed, archived
     assessment_type = Column(String(50), default="comprehensive")
@@ -190,6 +250,65 @@ class Assessment(Base):
     
     def set_interview_responses(self, responses_list):
         self.interview_responses = json.dumps(responses_list)
+    
+    def build_summary(self):
+        return {
+            'assessment_id': self.id,
+            'candidate_name': self.candidate.name if self.candidate else 'Unknown',
+            'job_title': self.job_description.title if self.job_description else 'Unknown',
+            'overall_score': self.overall_score,
+            'confidence_level': self.confidence_level,
+            'hiring_recommendation': self.hiring_recommendation,
+            'status': self.status,
+            'component_scores': {
+                'resume_analysis': self.resume_analysis_score,
+                'skill_match': self.skill_match_score,
+                'experience_relevance': self.experience_relevance_score,
+                'interview_performance': self.interview_performance_score,
+                'cultural_fit': self.cultural_fit_score
+            },
+            'strengths': self.get_strengths()[:3],  # Top 3 strengths
+            'development_areas': self.get_development_areas()[:3],  # Top 3 areas
+            'created_at': self.created_at,
+            'completed_at': self.completed_at
+        }
+    
+    def refresh_summary_json(self):
+        self.summary_json = json.dumps(self.build_summary(), default=_isoformat)
+
+# Assessment columns read by build_summary
+_SUMMARY_FIELDS = (
+    'candidate_id', 'job_description_id', 'overall_score', 'confidence_level',
+    'hiring_recommendation', 'status', 'resume_analysis_score', 'skill_match_score',
+    'experience_relevance_score', 'interview_performance_score', 'cultural_fit_score',
+    'strengths', 'development_areas', 'created_at', 'completed_at'
+)
+
+@event.listens_for(Assessment, "before_update")
+def _invalidate_summary_json(mapper, connection, target):
+    """Drop the stored summary when a field it shows changes, unless the same flush rebuilt it."""
+    state = inspect(target)
+    if state.attrs.summary_json.history.has_changes():
+        return
+    if any(state.attrs[field].history.has_changes() for field in _SUMMARY_FIELDS):
+        target.summary_json = None
+
+def _clear_summaries(connection, condition):
+    connection.execute(
+        update(Assessment.__table__)
+        .where(condition, Assessment.__table__.c.summary_json.isnot(None))
+        .values(summary_json=None)
+    )
+
+@event.listens_for(Candidate, "after_update")
+def _candidate_name_changed(mapper, connection, target):
+    if inspect(target).attrs.name.history.has_changes():
+        _clear_summaries(connection, Assessment.__table__.c.candidate_id == target.id)
+
+@event.listens_for(JobDescription, "after_update")
+def _job_title_changed(mapper, connection, target):
+    if inspect(target).attrs.title.history.has_changes():
+        _clear_summaries(connection, Assessment.__table__.c.job_description_id == target.id)
 
 class InterviewSession(Base):
     __tablename__ = "interview_sessions"
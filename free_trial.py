@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timedelta
 from typing import Optional
 
-from app.models.user_models import User, FreeTrialUser
+from app.models.user_models import User, FreeTrialUser, FREE_TRIAL_DURATION_HOURS
 from app.models.schemas import FreeTrialUserCreate, Token
 from app.db.session import get_db
 from sqlalchemy.orm import Session
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Mock database for demonstration purposes
 mock_free_trial_users = {}
@@ -18,8 +19,10 @@ async def register_free_trial_user(user: FreeTrialUserCreate):
     if user.email in mock_free_trial_users:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
     
-    # Simulate user creation and trial activation
-    trial_end_time = datetime.utcnow() + timedelta(hours=1) # 1 hour free trial
+    # Simulate user creation and trial activation. Rows inserted into the
+    # database get trial_end_time from the column's server default; this
+    # in-memory user never reaches it, so set the value here
+    trial_end_time = datetime.utcnow() + timedelta(hours=FREE_TRIAL_DURATION_HOURS)
     new_user = FreeTrialUser(
         email=user.email,
         full_name=user.full_name,
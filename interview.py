@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Dict, Optional
 import uuid
@@ -13,16 +14,18 @@ from app.models.schemas import (
     InterviewResponse,
     InterviewEvaluation,
     InterviewSessionCreate,
+    InterviewClientMessage,
     InterviewSession as InterviewSessionSchema,
     AssessmentCreate,
     Assessment as AssessmentSchema,
-    APIResponse
+    APIResponse,
+    from_orm_fast
 )
 from app.api.auth import get_current_active_user
 from app.services.interview_simulator import InterviewSimulator
 from app.services.assessment_engine import AssessmentEngine
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 # Initialize services
@@ -120,17 +123,7 @@ async def start_interview_session(
         assessment.set_interview_questions(questions)
         db.commit()
         
-        return InterviewSessionSchema(
-            id=interview_session.id,
-            assessment_id=interview_session.assessment_id,
-            session_token=interview_session.session_token,
-            current_question_index=interview_session.current_question_index,
-            total_questions=interview_session.total_questions,
-            status=interview_session.status,
-            started_at=interview_session.started_at,
-            completed_at=interview_session.completed_at,
-            expires_at=interview_session.expires_at
-        )
+        return from_orm_fast(InterviewSessionSchema, interview_session)
         
     except Exception as e:
         logger.error(f"Error starting interview session: {str(e)}")
@@ -265,6 +258,7 @@ async def submit_answer(
             assessment.set_interview_responses(responses)
             assessment.status = "completed"
             assessment.completed_at = datetime.utcnow()
+            assessment.refresh_summary_json()
         
         db.commit()
         
@@ -420,13 +414,14 @@ async def websocket_endpoint(websocket: WebSocket, session_token: str, db: Sessi
         while True:
             # Receive message from client
             data = await websocket.receive_text()
-            message = json.loads(data)
+            # Parse and validate in one pass in pydantic-core
+            message_type = InterviewClientMessage.model_validate_json(data).type
             
             # Handle different message types
-            if message.get("type") == "ping":
+            if message_type == "ping":
                 await manager.send_personal_message({"type": "pong"}, session_token)
             
-            elif message.get("type") == "get_current_question":
+            elif message_type == "get_current_question":
                 questions = session.get_questions_data()
                 if session.current_question_index < len(questions):
                     current_question = questions[session.current_question_index]
@@ -435,7 +430,7 @@ async def websocket_endpoint(websocket: WebSocket, session_token: str, db: Sessi
                         "question": current_question
                     }, session_token)
             
-            elif message.get("type") == "session_status":
+            elif message_type == "session_status":
                 await manager.send_personal_message({
                     "type": "session_status",
                     "status": session.status,
@@ -0,0 +1,191 @@
+"""
+Schema upgrades for databases created before the current models.
+
+create_all() only creates missing tables; it never alters existing ones.
+Run this once after deploying a schema change:
+
+    python -m app.db.migrations
+
+Every step inspects the live schema first, so running it again (or on a
+fresh database that create_all() already built) is a no-op.
+"""
+import logging
+
+from sqlalchemy import JSON, LargeBinary, Text, inspect, text
+
+from app.db.session import engine
+from app.models.database import _compress_text
+from app.models import user_models
+
+logger = logging.getLogger(__name__)
+
+# Rows rewritten per UPDATE batch while backfilling
+BACKFILL_BATCH_SIZE = 500
+
+def _columns(conn, table: str) -> set:
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return set()
+    return {column["name"] for column in inspector.get_columns(table)}
+
+def _columns_to_json(conn, table: str, names) -> None:
+    """
+    Text columns holding json.dumps() output -> native JSON. SQLite's JSON
+    type reads the same text, so only empty strings need clearing there;
+    PostgreSQL converts the column to JSONB in place.
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return
+    column_types = {column["name"]: column["type"] for column in inspector.get_columns(table)}
+    for name in names:
+        if name not in column_types or isinstance(column_types[name], JSON):
+            continue
+        conn.execute(text(f"UPDATE {table} SET {name} = NULL WHERE {name} = ''"))
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {name} TYPE JSONB USING {name}::jsonb"))
+
+def compress_resume_text(conn) -> None:
+    """
+    candidates.resume_text (plain text) -> candidates.resume_text_zst
+    (compressed binary): add the new column, backfill it in id batches,
+    then drop the old one.
+    """
+    columns = _columns(conn, "candidates")
+    if "resume_text" not in columns:
+        return
+    if "resume_text_zst" not in columns:
+        binary_type = LargeBinary().compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE candidates ADD COLUMN resume_text_zst {binary_type}"))
+
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text(
+                "SELECT id, resume_text FROM candidates "
+                "WHERE id > :last_id AND resume_text IS NOT NULL "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            text("UPDATE candidates SET resume_text_zst = :value WHERE id = :id"),
+            [{"id": row.id, "value": _compress_text(row.resume_text)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+    conn.execute(text("ALTER TABLE candidates DROP COLUMN resume_text"))
+
+def candidate_fields_to_json(conn) -> None:
+    _columns_to_json(conn, "candidates", ("extracted_skills", "extracted_experience", "extracted_education"))
+
+def user_model_fields_to_json(conn) -> None:
+    _columns_to_json(conn, "admins", ("permissions",))
+    _columns_to_json(conn, "assessments", ("assessment_data",))
+    _columns_to_json(conn, "interviews", ("questions", "responses"))
+
+def add_assessment_summary_json(conn) -> None:
+    """
+    Cached summary for assessments; NULL just means "build on read", so
+    existing rows need no backfill.
+    """
+    if "summary_json" in _columns(conn, "assessments"):
+        return
+    text_type = Text().compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE assessments ADD COLUMN summary_json {text_type}"))
+
+def create_user_model_indexes(conn) -> None:
+    """
+    Composite lookup indexes on user_models tables; skipped for any table
+    that does not exist yet or lacks the indexed columns.
+    """
+    for table in user_models.Base.metadata.sorted_tables:
+        columns = _columns(conn, table.name)
+        for index in table.indexes:
+            if {column.name for column in index.columns} <= columns:
+                index.create(conn, checkfirst=True)
+
+def add_user_model_foreign_keys(conn) -> None:
+    """
+    PostgreSQL only. Constraints are added NOT VALID: new writes are
+    checked, but legacy orphan rows do not block the upgrade (run
+    VALIDATE CONSTRAINT once they are cleaned up). SQLite cannot add
+    constraints to an existing table and does not enforce them without
+    PRAGMA foreign_keys anyway, so it is skipped; the ORM relationships
+    only need the model metadata.
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    inspector = inspect(conn)
+    for table in user_models.Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {tuple(fk["constrained_columns"]) for fk in inspector.get_foreign_keys(table.name)}
+        for constraint in table.foreign_key_constraints:
+            columns = tuple(constraint.column_keys)
+            if columns in existing:
+                continue
+            referred = constraint.elements[0].column.table.name
+            referred_columns = ", ".join(element.column.name for element in constraint.elements)
+            conn.execute(text(
+                f"ALTER TABLE {table.name} ADD CONSTRAINT fk_{table.name}_{'_'.join(columns)} "
+                f"FOREIGN KEY ({', '.join(columns)}) REFERENCES {referred} ({referred_columns}) NOT VALID"
+            ))
+
+def _rebuild_sqlite_table(conn, table) -> None:
+    """
+    SQLite cannot change a column's default in place: recreate the table
+    from the model and copy the shared columns across.
+    """
+    inspector = inspect(conn)
+    for index in inspector.get_indexes(table.name):
+        conn.execute(text(f"DROP INDEX {index['name']}"))
+    conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {table.name}_old"))
+    table.create(conn)
+    shared = ", ".join(
+        column["name"] for column in inspector.get_columns(f"{table.name}_old")
+        if column["name"] in table.columns
+    )
+    conn.execute(text(f"INSERT INTO {table.name} ({shared}) SELECT {shared} FROM {table.name}_old"))
+    conn.execute(text(f"DROP TABLE {table.name}_old"))
+
+def add_trial_end_default(conn) -> None:
+    """free_trial_users.trial_end_time gets its now() + trial length default."""
+    inspector = inspect(conn)
+    if not inspector.has_table("free_trial_users"):
+        return
+    column = next(
+        (column for column in inspector.get_columns("free_trial_users") if column["name"] == "trial_end_time"),
+        None,
+    )
+    if column is None or column["default"] is not None:
+        return
+    table = user_models.FreeTrialUser.__table__
+    if conn.dialect.name == "sqlite":
+        _rebuild_sqlite_table(conn, table)
+        return
+    default = user_models._trial_end_default().compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE free_trial_users ALTER COLUMN trial_end_time SET DEFAULT {default}"))
+
+# Applied in order, each in its own transaction
+MIGRATIONS = [
+    compress_resume_text,
+    candidate_fields_to_json,
+    user_model_fields_to_json,
+    add_assessment_summary_json,
+    create_user_model_indexes,
+    add_user_model_foreign_keys,
+    add_trial_end_default,
+]
+
+def upgrade() -> None:
+    for step in MIGRATIONS:
+        with engine.begin() as conn:
+            step(conn)
+        logger.info("Applied migration step %s", step.__name__)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    upgrade()
@@ -1,12 +1,144 @@
+"""
+Resume NLP analysis service.
+
+Loading the spaCy model and building the skill tables is expensive, so callers
+should share one analyzer per process via ``get_analyzer()`` rather than
+constructing ``NLPAnalyzer()`` per request. When served by gunicorn with
+``preload_app=True`` the cached instance is also shared copy-on-write across
+forked workers.
+
+The public ``extract_skills``, ``analyze_experience`` and ``analyze_education``
+results are memoized per analyzer, keyed by a digest of the resume text, so
+re-analyzing the same resume (e.g. re-ranking against a new job posting) skips
+the spaCy and regex work.
+
+Setting ``NLP_SERVER_ADDRESS`` to a Unix socket path makes ``get_analyzer()``
+return a proxy to one analyzer served by a separate process
+(``python -m app.services.nlp_analyzer``) instead of loading the model in
+every worker. ``NLP_SERVER_AUTHKEY`` must be set and match on both sides: the manager
+unpickles what clients send, so the key is what keeps other local processes
+from running code in the server.
+"""
+
+import os
+import stat
 import spacy
 import re
-from typing import Dict, List, Set, Tuple, Optional
-from collections import Counter
+import copy
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Set, Tuple, Optional
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from multiprocessing.managers import BaseManager
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Unix socket of the shared analyzer server; unset loads the model in-process
+NLP_SERVER_ADDRESS = os.environ.get("NLP_SERVER_ADDRESS")
+NLP_SERVER_AUTHKEY = os.environ.get("NLP_SERVER_AUTHKEY", "").encode()
+
+# Number of analysis results kept in each analyzer's LRU cache
+_RESULT_CACHE_SIZE = 256
+
+# Education levels in precedence order (highest first)
+_EDU_LEVELS = [
+    ('doctorate', re.compile(r'phd|doctorate')),
+    ('masters', re.compile(r'master|mba')),
+    ('bachelors', re.compile(r'bachelor')),
+    ('associates', re.compile(r'associate'))
+]
+
+# Bullet / duty line patterns used for responsibilities and achievements
+_RESPONSIBILITY_PATTERNS = [
+    re.compile(r'[•·▪▫◦‣⁃]\s*([^•·▪▫◦‣⁃\n]+)'),
+    re.compile(r'^\s*[-*]\s*([^-*\n]+)', re.MULTILINE),
+    re.compile(r'(?i:responsible for|responsibilities include|duties include):\s*([^\n]+)')
+]
+
+# Certification patterns; matched case-insensitively because the original
+# casing of the captured text is reported back
+_CERT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        r'certified\s+[\w\s]+',
+        r'[\w\s]+\s+certified',
+        r'[\w\s]+\s+certification',
+        r'aws\s+[\w\s]+',
+        r'microsoft\s+[\w\s]+',
+        r'google\s+[\w\s]+',
+        r'cisco\s+[\w\s]+',
+        r'oracle\s+[\w\s]+',
+        r'pmp\b',
+        r'cissp\b',
+        r'cisa\b',
+        r'cism\b'
+    ]
+]
+
+# Date range patterns, run against lowercased text
+_DATE_PATTERNS = [
+    re.compile(r'(\d{4})\s*[-–—]\s*(\d{4})'),
+    re.compile(r'(\d{4})\s*[-–—]\s*present'),
+    re.compile(r'(\d{1,2}/\d{4})\s*[-–—]\s*(\d{1,2}/\d{4})'),
+    re.compile(r'(\d{1,2}/\d{4})\s*[-–—]\s*present'),
+    re.compile(r'(\w+\s+\d{4})\s*[-–—]\s*(\w+\s+\d{4})'),
+    re.compile(r'(\w+\s+\d{4})\s*[-–—]\s*present')
+]
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Job title patterns: title words must be capitalized, keywords may be any case
+_TITLE_KEYWORDS = r'(?i:Engineer|Developer|Manager|Analyst|Specialist|Coordinator|Assistant|Director|Lead|Senior|Junior|Principal|Staff)'
+_JOB_TITLE_PATTERNS = [
+    re.compile(r'(?:^|\n)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+' + _TITLE_KEYWORDS + r'))\s*(?:\n|$)', re.MULTILINE),
+    re.compile(r'(?i:Position|Role|Title):\s*([^\n]+)'),
+    re.compile(r'(?i:as|as a|as an)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+' + _TITLE_KEYWORDS + r'))')
+]
+
+# Degree patterns; case-insensitive since the matched text is reported back
+_DEGREE_PATTERNS = [
+    re.compile(r'\b(?:Bachelor|Master|PhD|Doctorate|Associate|MBA|MS|BS|BA|MA|MSc|BSc)\b[^.]*', re.IGNORECASE),
+    re.compile(r'\b(?:B\.?A\.?|B\.?S\.?|M\.?A\.?|M\.?S\.?|Ph\.?D\.?|MBA)\b[^.]*', re.IGNORECASE)
+]
+
+_GPA_RE = re.compile(r'gpa[:\s]*(\d+\.?\d*)')
+
+# Academic honors, matched as plain substrings of lowercased text
+_HONORS = [
+    'magna cum laude',
+    'summa cum laude',
+    'cum laude',
+    "dean's list",
+    'honor roll',
+    'valedictorian',
+    'salutatorian'
+]
+
+# Any of these words marks a bullet as an achievement
+_ACHIEVEMENT_RE = re.compile(
+    r'achieved|improved|increased|decreased|reduced|implemented|developed|created|led|managed|delivered',
+    re.IGNORECASE
+)
+
+# Maximum number of responsibilities / achievements reported
+_MAX_ITEMS = 10
+
+# Seniority levels in increasing order; group vN marks level index N
+_SENIORITY_LEVELS = ['intern', 'junior', 'associate', 'mid', 'senior', 'lead', 'principal', 'director', 'vp']
+_SENIORITY_RE = re.compile(
+    '|'.join(f'(?P<v{i}>{level})' for i, level in enumerate(_SENIORITY_LEVELS)),
+    re.IGNORECASE
+)
+_DEFAULT_SENIORITY = 3  # mid-level
+
+# Job title keyword groups for career progression
+_LEADERSHIP_RE = re.compile(r'manager|director|lead|head|vp|chief', re.IGNORECASE)
+_TECHNICAL_RE = re.compile(r'engineer|developer|architect|specialist|analyst', re.IGNORECASE)
+
+# Organization names that look like educational institutions
+_EDU_INSTITUTION_RE = re.compile(r'university|college|institute|school|academy', re.IGNORECASE)
+
 class NLPAnalyzer:
     """
     Advanced Natural Language Processing service for resume analysis.
@@ -20,6 +152,10 @@ class NLPAnalyzer:
             logger.error("spaCy English model not found. Please install with: python -m spacy download en_core_web_sm")
             raise
         
+        # LRU cache of analysis results keyed by (analysis, text digest)
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
         # Technical skills database
         self.technical_skills = {
             'programming_languages': [
@@ -59,6 +195,17 @@ class NLPAnalyzer:
             'public speaking', 'writing', 'research', 'organization', 'attention to detail'
         ]
         
+        # Word-boundary patterns for every known skill, compiled once
+        self._skill_patterns = {
+            skill: re.compile(r'\b' + re.escape(skill) + r'\b')
+            for skills_list in self.technical_skills.values()
+            for skill in skills_list
+        }
+        self._skill_patterns.update({
+            skill: re.compile(r'\b' + re.escape(skill) + r'\b')
+            for skill in self.soft_skills
+        })
+        
         # Experience level indicators
         self.experience_indicators = {
             'junior': ['junior', 'entry level', 'associate', 'intern', 'trainee', 'graduate'],
@@ -66,70 +213,130 @@ class NLPAnalyzer:
             'senior': ['senior', 'lead', 'principal', 'staff', 'expert', 'architect'],
             'executive': ['manager', 'director', 'vp', 'vice president', 'ceo', 'cto', 'head of']
         }
+        
+        # One alternation over all indicators; the named group tells the level.
+        # Levels are listed in increasing seniority, so the index is the priority.
+        self._level_priority = {level: i for i, level in enumerate(self.experience_indicators)}
+        self._experience_level_re = re.compile('|'.join(
+            f"(?P<{level}>\\b(?:{'|'.join(re.escape(ind) for ind in indicators)})\\b)"
+            for level, indicators in self.experience_indicators.items()
+        ))
+        
+        # Common variations of the same technology
+        self.skill_variations = {
+            'javascript': ['js', 'node.js', 'nodejs'],
+            'typescript': ['ts'],
+            'python': ['py'],
+            'postgresql': ['postgres'],
+            'mongodb': ['mongo'],
+            'kubernetes': ['k8s'],
+            'docker': ['containerization'],
+            'aws': ['amazon web services'],
+            'gcp': ['google cloud platform', 'google cloud']
+        }
+        
+        # Map every variation (and the main name) to its canonical skill
+        self._canon = {}
+        for main_skill, variants in self.skill_variations.items():
+            self._canon[main_skill] = main_skill
+            for variant in variants:
+                self._canon[variant] = main_skill
     
-    def extract_skills(self, text: str) -> Dict[str, List[str]]:
+    def extract_skills(self, text: str, text_lower: Optional[str] = None) -> Dict[str, List[str]]:
         """
         Extract technical and soft skills from resume text.
         
         Args:
             text: Resume text
+            text_lower: Lowercased resume text, if the caller already has it
             
         Returns:
             Dictionary categorizing found skills
         """
-        text_lower = text.lower()
-        doc = self.nlp(text)
+        return self._cached_analysis(
+            'skills', text, lambda: self._compute_skills(text, text_lower)
+        )
+    
+    def _compute_skills(self, text: str, text_lower: Optional[str], doc=None) -> Dict[str, List[str]]:
+        """
+        Uncached implementation of extract_skills.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        if doc is None:
+            doc = self.nlp(text)
         
+        # Collect into sets so duplicates are dropped as we go
         found_skills = {
-            'technical_skills': {
-                'programming_languages': [],
-                'frameworks_libraries': [],
-                'databases': [],
-                'cloud_platforms': [],
-                'tools_technologies': [],
-                'methodologies': []
-            },
-            'soft_skills': [],
+            'technical_skills': {category: set() for category in self.technical_skills},
+            'soft_skills': set(),
             'certifications': [],
-            'all_skills': []
+            'all_skills': set()
         }
         
         # Extract technical skills
         for category, skills_list in self.technical_skills.items():
             for skill in skills_list:
                 if self._find_skill_in_text(skill, text_lower):
-                    found_skills['technical_skills'][category].append(skill)
-                    found_skills['all_skills'].append(skill)
+                    found_skills['technical_skills'][category].add(skill)
+                    found_skills['all_skills'].add(skill)
         
         # Extract soft skills
         for skill in self.soft_skills:
             if self._find_skill_in_text(skill, text_lower):
-                found_skills['soft_skills'].append(skill)
-                found_skills['all_skills'].append(skill)
+                found_skills['soft_skills'].add(skill)
+                found_skills['all_skills'].add(skill)
         
         # Extract certifications using NER and patterns
         certifications = self._extract_certifications(text, doc)
         found_skills['certifications'] = certifications
         
-        # Remove duplicates
-        for category in found_skills['technical_skills']:
-            found_skills['technical_skills'][category] = list(set(found_skills['technical_skills'][category]))
-        found_skills['soft_skills'] = list(set(found_skills['soft_skills']))
-        found_skills['all_skills'] = list(set(found_skills['all_skills']))
+        # Materialize sets as lists for JSON serialization
+        found_skills['technical_skills'] = {
+            category: sorted(skills) for category, skills in found_skills['technical_skills'].items()
+        }
+        found_skills['soft_skills'] = sorted(found_skills['soft_skills'])
+        found_skills['all_skills'] = sorted(found_skills['all_skills'])
         
         return found_skills
     
+    def _cached_analysis(self, kind: str, text: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a copy of the cached result for this text, computing it on a miss.
+        Copies are handed out so callers can't mutate the cached value.
+        """
+        key = (kind, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+        
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+        
+        result = compute()
+        
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return copy.deepcopy(result)
+    
     def _find_skill_in_text(self, skill: str, text: str) -> bool:
         """
         Find skill in text using various matching strategies.
+        Both skill and text are expected to be lowercase.
         """
         # Exact match
         if skill in text:
             return True
         
         # Word boundary match
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text, re.IGNORECASE):
+        pattern = self._skill_patterns.get(skill)
+        if pattern is None:
+            pattern = re.compile(r'\b' + re.escape(skill) + r'\b')
+        if pattern.search(text):
             return True
         
         # Handle special cases (e.g., "node.js" vs "node")
@@ -146,42 +353,38 @@ class NLPAnalyzer:
         """
         certifications = []
         
-        # Common certification patterns
-        cert_patterns = [
-            r'certified\s+[\w\s]+',
-            r'[\w\s]+\s+certified',
-            r'[\w\s]+\s+certification',
-            r'aws\s+[\w\s]+',
-            r'microsoft\s+[\w\s]+',
-            r'google\s+[\w\s]+',
-            r'cisco\s+[\w\s]+',
-            r'oracle\s+[\w\s]+',
-            r'pmp\b',
-            r'cissp\b',
-            r'cisa\b',
-            r'cism\b'
-        ]
-        
-        for pattern in cert_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _CERT_PATTERNS:
+            for match in pattern.finditer(text):
                 cert = match.group().strip()
                 if len(cert) > 3 and len(cert) < 100:  # Reasonable length
                     certifications.append(cert)
         
         return list(set(certifications))
     
-    def analyze_experience(self, text: str) -> Dict[str, any]:
+    def analyze_experience(self, text: str, text_lower: Optional[str] = None) -> Dict[str, any]:
         """
         Analyze work experience from resume text.
         
         Args:
             text: Resume text
+            text_lower: Lowercased resume text, if the caller already has it
             
         Returns:
             Dictionary with experience analysis
         """
-        doc = self.nlp(text)
+        return self._cached_analysis(
+            'experience', text, lambda: self._compute_experience(text, text_lower)
+        )
+    
+    def _compute_experience(self, text: str, text_lower: Optional[str], doc=None) -> Dict[str, any]:
+        """
+        Uncached implementation of analyze_experience.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        if doc is None:
+            doc = self.nlp(text)
         
         experience_analysis = {
             'total_years': 0,
@@ -199,14 +402,14 @@ class NLPAnalyzer:
         experience_analysis['companies'] = list(set(organizations))
         
         # Extract dates and calculate experience
-        dates = self._extract_dates(text)
+        dates = self._extract_dates(text_lower)
         if dates:
             experience_analysis['total_years'] = self._calculate_total_experience(dates)
             experience_analysis['employment_gaps'] = self._identify_gaps(dates)
         
         # Determine experience level
         experience_analysis['experience_level'] = self._determine_experience_level(
-            text, experience_analysis['total_years']
+            text_lower, experience_analysis['total_years']
         )
         
         # Extract job titles
@@ -223,36 +426,26 @@ class NLPAnalyzer:
         
         return experience_analysis
     
-    def _extract_dates(self, text: str) -> List[Tuple[int, int]]:
+    def _extract_dates(self, text_lower: str) -> List[Tuple[int, int]]:
         """
-        Extract date ranges from text.
+        Extract date ranges from lowercased text.
         """
-        date_patterns = [
-            r'(\d{4})\s*[-–—]\s*(\d{4})',
-            r'(\d{4})\s*[-–—]\s*present',
-            r'(\d{1,2}/\d{4})\s*[-–—]\s*(\d{1,2}/\d{4})',
-            r'(\d{1,2}/\d{4})\s*[-–—]\s*present',
-            r'(\w+\s+\d{4})\s*[-–—]\s*(\w+\s+\d{4})',
-            r'(\w+\s+\d{4})\s*[-–—]\s*present'
-        ]
-        
         dates = []
         current_year = datetime.now().year
         
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _DATE_PATTERNS:
+            for match in pattern.finditer(text_lower):
                 start_str, end_str = match.groups()
                 
                 try:
                     # Extract year from start date
-                    start_year = int(re.search(r'\d{4}', start_str).group())
+                    start_year = int(_YEAR_RE.search(start_str).group())
                     
                     # Extract year from end date
-                    if 'present' in end_str.lower():
+                    if 'present' in end_str:
                         end_year = current_year
                     else:
-                        end_year = int(re.search(r'\d{4}', end_str).group())
+                        end_year = int(_YEAR_RE.search(end_str).group())
                     
                     if start_year <= end_year <= current_year:
                         dates.append((start_year, end_year))
@@ -303,17 +496,21 @@ class NLPAnalyzer:
         
         return gaps
     
-    def _determine_experience_level(self, text: str, total_years: float) -> str:
+    def _determine_experience_level(self, text_lower: str, total_years: float) -> str:
         """
         Determine experience level based on years and job titles.
         """
-        text_lower = text.lower()
-        
-        # Check for explicit level indicators in text
-        for level, indicators in self.experience_indicators.items():
-            for indicator in indicators:
-                if indicator in text_lower:
-                    return level
+        # Check for explicit level indicators in text, keeping the most senior one
+        top_level = None
+        top_priority = len(self._level_priority) - 1
+        for match in self._experience_level_re.finditer(text_lower):
+            level = match.lastgroup
+            if top_level is None or self._level_priority[level] > self._level_priority[top_level]:
+                top_level = level
+                if self._level_priority[level] == top_priority:
+                    break
+        if top_level:
+            return top_level
         
         # Determine by years of experience
         if total_years < 2:
@@ -329,17 +526,10 @@ class NLPAnalyzer:
         """
         Extract job titles from resume text.
         """
-        job_title_patterns = [
-            r'(?:^|\n)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator|Assistant|Director|Lead|Senior|Junior|Principal|Staff)))\s*(?:\n|$)',
-            r'(?:Position|Role|Title):\s*([^\n]+)',
-            r'(?:as|as a|as an)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator|Assistant|Director|Lead|Senior|Junior|Principal|Staff)))'
-        ]
-        
         job_titles = []
         
-        for pattern in job_title_patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
+        for pattern in _JOB_TITLE_PATTERNS:
+            for match in pattern.finditer(text):
                 title = match.group(1).strip()
                 if len(title) > 3 and len(title) < 100:
                     job_titles.append(title)
@@ -353,29 +543,22 @@ class NLPAnalyzer:
         responsibilities = []
         achievements = []
         
-        # Patterns for responsibilities
-        resp_patterns = [
-            r'[•·▪▫◦‣⁃]\s*([^•·▪▫◦‣⁃\n]+)',
-            r'^\s*[-*]\s*([^-*\n]+)',
-            r'(?:Responsible for|Responsibilities include|Duties include):\s*([^\n]+)'
-        ]
-        
-        # Patterns for achievements
-        achievement_keywords = ['achieved', 'improved', 'increased', 'decreased', 'reduced', 
-                              'implemented', 'developed', 'created', 'led', 'managed', 'delivered']
-        
-        for pattern in resp_patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
+        for pattern in _RESPONSIBILITY_PATTERNS:
+            for match in pattern.finditer(text):
                 item = match.group(1).strip()
                 if len(item) > 10:
                     # Check if it's an achievement
-                    if any(keyword in item.lower() for keyword in achievement_keywords):
-                        achievements.append(item)
-                    else:
+                    if _ACHIEVEMENT_RE.search(item):
+                        if len(achievements) < _MAX_ITEMS:
+                            achievements.append(item)
+                    elif len(responsibilities) < _MAX_ITEMS:
                         responsibilities.append(item)
+                
+                # Stop scanning once both lists are full
+                if len(responsibilities) >= _MAX_ITEMS and len(achievements) >= _MAX_ITEMS:
+                    return responsibilities, achievements
         
-        return responsibilities[:10], achievements[:10]  # Limit to top 10 each
+        return responsibilities, achievements
     
     def _analyze_career_progression(self, job_titles: List[str]) -> Dict[str, any]:
         """
@@ -391,49 +574,51 @@ class NLPAnalyzer:
         if len(job_titles) < 2:
             return progression
         
-        # Check for seniority progression
-        seniority_levels = ['intern', 'junior', 'associate', 'mid', 'senior', 'lead', 'principal', 'director', 'vp']
+        # Check for seniority progression (lowest level named in a title wins)
         title_levels = []
         
         for title in job_titles:
-            title_lower = title.lower()
-            for i, level in enumerate(seniority_levels):
-                if level in title_lower:
-                    title_levels.append(i)
-                    break
-            else:
-                title_levels.append(3)  # Default to mid-level
+            levels = [int(match.lastgroup[1:]) for match in _SENIORITY_RE.finditer(title)]
+            title_levels.append(min(levels) if levels else _DEFAULT_SENIORITY)
         
         if len(title_levels) > 1:
             progression['shows_growth'] = max(title_levels) > min(title_levels)
             progression['progression_score'] = max(title_levels) - min(title_levels)
         
         # Check for leadership progression
-        leadership_keywords = ['manager', 'director', 'lead', 'head', 'vp', 'chief']
         progression['leadership_progression'] = any(
-            any(keyword in title.lower() for keyword in leadership_keywords)
-            for title in job_titles
+            _LEADERSHIP_RE.search(title) for title in job_titles
         )
         
         # Check for technical progression
-        technical_keywords = ['engineer', 'developer', 'architect', 'specialist', 'analyst']
         progression['technical_progression'] = any(
-            any(keyword in title.lower() for keyword in technical_keywords)
-            for title in job_titles
+            _TECHNICAL_RE.search(title) for title in job_titles
         )
         
         return progression
     
-    def analyze_education(self, text: str) -> Dict[str, any]:
+    def analyze_education(self, text: str, text_lower: Optional[str] = None) -> Dict[str, any]:
         """
         Analyze educational background from resume text.
         
         Args:
             text: Resume text
+            text_lower: Lowercased resume text, if the caller already has it
             
         Returns:
             Dictionary with education analysis
         """
+        return self._cached_analysis(
+            'education', text, lambda: self._compute_education(text, text_lower)
+        )
+    
+    def _compute_education(self, text: str, text_lower: Optional[str], doc=None) -> Dict[str, any]:
+        """
+        Uncached implementation of analyze_education.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        
         education_analysis = {
             'degrees': [],
             'institutions': [],
@@ -444,48 +629,36 @@ class NLPAnalyzer:
             'education_level': 'high_school'
         }
         
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         
         # Extract institutions using NER
         organizations = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
         
         # Filter for educational institutions
-        edu_keywords = ['university', 'college', 'institute', 'school', 'academy']
-        institutions = []
-        for org in organizations:
-            if any(keyword in org.lower() for keyword in edu_keywords):
-                institutions.append(org)
+        institutions = [org for org in organizations if _EDU_INSTITUTION_RE.search(org)]
         
         education_analysis['institutions'] = institutions
         
         # Extract degrees
-        degree_patterns = [
-            r'\b(?:Bachelor|Master|PhD|Doctorate|Associate|MBA|MS|BS|BA|MA|MSc|BSc)\b[^.]*',
-            r'\b(?:B\.?A\.?|B\.?S\.?|M\.?A\.?|M\.?S\.?|Ph\.?D\.?|MBA)\b[^.]*'
-        ]
-        
         degrees = []
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _DEGREE_PATTERNS:
+            for match in pattern.finditer(text):
                 degree = match.group().strip()
                 if len(degree) < 100:  # Reasonable length
                     degrees.append(degree)
         
         education_analysis['degrees'] = list(set(degrees))
         
-        # Determine education level
-        if any('phd' in degree.lower() or 'doctorate' in degree.lower() for degree in degrees):
-            education_analysis['education_level'] = 'doctorate'
-        elif any('master' in degree.lower() or 'mba' in degree.lower() for degree in degrees):
-            education_analysis['education_level'] = 'masters'
-        elif any('bachelor' in degree.lower() for degree in degrees):
-            education_analysis['education_level'] = 'bachelors'
-        elif any('associate' in degree.lower() for degree in degrees):
-            education_analysis['education_level'] = 'associates'
+        # Determine education level (highest level found wins)
+        joined_degrees = ' '.join(degrees).lower()
+        for level, pattern in _EDU_LEVELS:
+            if pattern.search(joined_degrees):
+                education_analysis['education_level'] = level
+                break
         
         # Extract GPA
-        gpa_match = re.search(r'gpa[:\s]*(\d+\.?\d*)', text, re.IGNORECASE)
+        gpa_match = _GPA_RE.search(text_lower)
         if gpa_match:
             try:
                 education_analysis['gpa'] = float(gpa_match.group(1))
@@ -493,25 +666,39 @@ class NLPAnalyzer:
                 pass
         
         # Extract honors
-        honor_patterns = [
-            r'magna cum laude',
-            r'summa cum laude',
-            r'cum laude',
-            r'dean\'s list',
-            r'honor roll',
-            r'valedictorian',
-            r'salutatorian'
-        ]
-        
-        honors = []
-        for pattern in honor_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                honors.append(pattern.title())
+        honors = [honor.title() for honor in _HONORS if honor in text_lower]
         
         education_analysis['honors'] = honors
         
         return education_analysis
     
+    def analyze_resume_text(self, text: str, text_lower: Optional[str] = None) -> Tuple[Dict, Dict, Dict]:
+        """
+        Skills, experience and education for one resume. The three analyses
+        share a single spaCy parse, made only if one of them misses the cache.
+        
+        Args:
+            text: Resume text
+            text_lower: Lowercased resume text, if the caller already has it
+            
+        Returns:
+            (skills, experience, education), as from the individual methods
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        parsed = []
+        def doc():
+            if not parsed:
+                parsed.append(self.nlp(text))
+            return parsed[0]
+        
+        return (
+            self._cached_analysis('skills', text, lambda: self._compute_skills(text, text_lower, doc())),
+            self._cached_analysis('experience', text, lambda: self._compute_experience(text, text_lower, doc())),
+            self._cached_analysis('education', text, lambda: self._compute_education(text, text_lower, doc())),
+        )
+    
     def calculate_job_match_score(self, candidate_skills: List[str], job_requirements: List[str]) -> Dict[str, any]:
         """
         Calculate how well candidate skills match job requirements.
@@ -562,22 +749,73 @@ class NLPAnalyzer:
             return True
         
         # Handle common variations
-        variations = {
-            'javascript': ['js', 'node.js', 'nodejs'],
-            'typescript': ['ts'],
-            'python': ['py'],
-            'postgresql': ['postgres'],
-            'mongodb': ['mongo'],
-            'kubernetes': ['k8s'],
-            'docker': ['containerization'],
-            'aws': ['amazon web services'],
-            'gcp': ['google cloud platform', 'google cloud']
-        }
-        
-        for main_skill, variants in variations.items():
-            if (skill1 == main_skill and skill2 in variants) or \
-               (skill2 == main_skill and skill1 in variants):
-                return True
-        
-        return False
+        return self._canon.get(skill1, skill1) == self._canon.get(skill2, skill2)
+
+
+@lru_cache(maxsize=1)
+def _local_analyzer() -> NLPAnalyzer:
+    """The NLPAnalyzer owned by this process."""
+    return NLPAnalyzer()
+
+
+class _AnalyzerServer(BaseManager):
+    """Exposes this process's analyzer to other processes."""
+
+
+class _AnalyzerClient(BaseManager):
+    """Connects to an _AnalyzerServer."""
+
+
+_AnalyzerServer.register('get_analyzer', callable=_local_analyzer)
+_AnalyzerClient.register('get_analyzer')
+
+
+def _server_authkey() -> bytes:
+    if not NLP_SERVER_AUTHKEY:
+        raise ValueError("NLP_SERVER_AUTHKEY must be set to use the analyzer server")
+    return NLP_SERVER_AUTHKEY
+
+
+@lru_cache(maxsize=1)
+def get_analyzer() -> "NLPAnalyzer":
+    """
+    Return the process-wide shared analyzer: a proxy to the analyzer server
+    when NLP_SERVER_ADDRESS is set, otherwise a local NLPAnalyzer. The proxy
+    exposes the same public methods and reconnects after fork.
+    """
+    if NLP_SERVER_ADDRESS:
+        client = _AnalyzerClient(address=NLP_SERVER_ADDRESS, authkey=_server_authkey())
+        client.connect()
+        return client.get_analyzer()
+    return _local_analyzer()
+
+
+def serve_analyzer(address: Optional[str] = NLP_SERVER_ADDRESS) -> None:
+    """
+    Load the model once and serve it on a Unix socket until killed. Each
+    client connection is handled on its own thread.
+    """
+    if not address:
+        raise ValueError("NLP_SERVER_ADDRESS is not set")
+    authkey = _server_authkey()
+    
+    _local_analyzer()
+    if os.path.lexists(address):
+        # Only ever remove a stale socket from a previous run
+        if not stat.S_ISSOCK(os.lstat(address).st_mode):
+            raise ValueError(f"{address} exists and is not a socket")
+        os.unlink(address)
+    
+    # Create the socket readable and writable by its owner only
+    old_umask = os.umask(0o077)
+    try:
+        server = _AnalyzerServer(address=address, authkey=authkey).get_server()
+    finally:
+        os.umask(old_umask)
+    logger.info(f"NLP analyzer server listening on {address}")
+    server.serve_forever()
+
 
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    serve_analyzer()
@@ -1,11 +1,248 @@
 import PyPDF2
 import pdfplumber
 import re
-from typing import Dict, List, Optional, Tuple
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple, Union
 import logging
+from bisect import bisect_right
+from itertools import accumulate
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional native extractor
+    pdfium = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional multi-pattern matcher
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # optional DFA-based multi-regex scanner
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
+# Contact and formatting patterns, compiled once at import
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = [
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),
+    re.compile(r'\(\d{3}\)\s*\d{3}[-.]?\d{4}\b'),
+    re.compile(r'\+\d{1,3}\s*\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+]
+_ANY_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b|\(\d{3}\)\s*\d{3}[-.]?\d{4}\b')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
+_BULLET_CHARS = '•·▪▫◦‣⁃'
+_NUMBERED_PREFIX_RE = re.compile(r'\d+\.')
+_DATE_RE = re.compile(r'\b\d{4}\b|\b\d{1,2}/\d{4}\b|\b\w+\s+\d{4}\b')
+# '.' never crosses a newline, so this still matches within a single line
+# when scanned over the whole text
+_DATE_RANGE_RE = re.compile(r'\b\d{4}\b.*\b\d{4}\b|\b\d{4}\b.*present', re.IGNORECASE)
+# A digit or a common header word disqualifies a line as the candidate's name
+_NAME_REJECT = re.compile(r'\d|resume|cv|curriculum|vitae|contact|information', re.IGNORECASE)
+
+
+def _has_bullet_points(text: str) -> bool:
+    """True if any bullet glyph occurs; each substring search stops at its first hit."""
+    return any(bullet in text for bullet in _BULLET_CHARS)
+
+
+def _has_numbered_list(lines: List[str]) -> bool:
+    """True if some line starts (after indentation) with a number and a dot."""
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped[:1].isdecimal() and _NUMBERED_PREFIX_RE.match(stripped):
+            return True
+    return False
+
+# Technical terms that mark a line as part of a skills section
+_SKILL_KEYWORDS = ['python', 'java', 'javascript', 'sql', 'aws', 'docker', 'kubernetes',
+                   'react', 'angular', 'vue', 'node', 'spring', 'django', 'flask']
+
+# Match all keywords in one pass: Aho-Corasick when available, else one alternation
+if ahocorasick is not None:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _SKILL_KEYWORDS:
+        _SKILL_AUTOMATON.add_word(_keyword, _keyword)
+    _SKILL_AUTOMATON.make_automaton()
+    
+    def _has_skill_keyword(line_lower: str) -> bool:
+        return next(_SKILL_AUTOMATON.iter(line_lower), None) is not None
+else:
+    _SKILL_KEYWORD_RE = re.compile('|'.join(map(re.escape, _SKILL_KEYWORDS)))
+    
+    def _has_skill_keyword(line_lower: str) -> bool:
+        return _SKILL_KEYWORD_RE.search(line_lower) is not None
+
+# Largest PDF accepted by validate_pdf_security
+_MAX_PDF_SIZE = 10 * 1024 * 1024
+
+# Number of entries kept in each processor's LRU caches
+_TEXT_CACHE_SIZE = 256
+_STRUCTURE_CACHE_SIZE = 64
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping used for per-processor memoization."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+def _text_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+@dataclass(frozen=True)
+class ParsedResume:
+    """
+    Resume text together with the derived views the extractors share,
+    computed once per document instead of once per method.
+    """
+    raw: str
+    lower: str
+    lines: List[str]
+    lines_lower: List[str]
+    line_starts: List[int]
+    
+    @classmethod
+    def from_text(cls, text: str) -> "ParsedResume":
+        lower = text.lower()
+        lines = text.split('\n')
+        line_starts = [0]
+        line_starts.extend(accumulate(len(line) + 1 for line in lines[:-1]))
+        # lower() maps characters one to one around '\n', so the lines still align
+        return cls(text, lower, lines, lower.split('\n'), line_starts)
+    
+    @cached_property
+    def digest(self) -> bytes:
+        return _text_digest(self.raw)
+    
+    def line_index(self, offset: int) -> int:
+        """Index of the line containing the given offset into raw."""
+        return bisect_right(self.line_starts, offset) - 1
+
+
+# What Python's \s matches within ASCII; Hyperscan's \s omits \x1c-\x1f
+_HS_WHITESPACE = r'[\t\n\x0b\x0c\r \x1c-\x1f]'
+
+
+# Resume section headers; earlier patterns in a section take precedence
+SECTION_PATTERNS = MappingProxyType({
+    'contact': (
+        r'contact\s+information',
+        r'personal\s+details',
+        r'contact\s+details'
+    ),
+    'summary': (
+        r'professional\s+summary',
+        r'career\s+summary',
+        r'summary',
+        r'profile',
+        r'objective',
+        r'career\s+objective'
+    ),
+    'experience': (
+        r'work\s+experience',
+        r'professional\s+experience',
+        r'employment\s+history',
+        r'career\s+history',
+        r'experience'
+    ),
+    'education': (
+        r'education',
+        r'academic\s+background',
+        r'educational\s+background',
+        r'qualifications'
+    ),
+    'skills': (
+        r'skills',
+        r'technical\s+skills',
+        r'core\s+competencies',
+        r'competencies',
+        r'expertise'
+    ),
+    'certifications': (
+        r'certifications',
+        r'certificates',
+        r'professional\s+certifications',
+        r'licenses'
+    ),
+    'projects': (
+        r'projects',
+        r'key\s+projects',
+        r'notable\s+projects',
+        r'project\s+experience'
+    )
+})
+
+# All section patterns fused into one alternation scanned in a single
+# pass. Group "<section>__<i>" marks pattern i of that section; the
+# lookahead keeps matches zero-width so overlapping headers (e.g.
+# "project experience") are seen by every section they belong to.
+_SECTION_IDS = [(name, i) for name, patterns in SECTION_PATTERNS.items()
+                for i in range(len(patterns))]
+_SECTION_GROUPS = {f'{name}__{i}': (name, i) for name, i in _SECTION_IDS}
+_SECTION_MASTER_RE = re.compile(
+    '(?=' + '|'.join(f'(?P<{name}__{i}>{SECTION_PATTERNS[name][i]})' for name, i in _SECTION_IDS) + ')',
+    re.IGNORECASE
+)
+
+# Same patterns as a Hyperscan database when available; ids follow
+# alternation order so per-offset precedence can be reproduced
+if hyperscan is not None:
+    _SECTION_HS_DB = hyperscan.Database()
+    _SECTION_HS_DB.compile(
+        expressions=[
+            SECTION_PATTERNS[name][i].replace(r'\s', _HS_WHITESPACE).encode('ascii')
+            for name, i in _SECTION_IDS
+        ],
+        ids=list(range(len(_SECTION_IDS))),
+        elements=len(_SECTION_IDS),
+        flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+    )
+else:
+    _SECTION_HS_DB = None
+
+# Hyperscan scratch space is not thread-safe; keep one per thread
+_hs_local = threading.local()
+
+
+def _hs_scratch():
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_SECTION_HS_DB)
+    return scratch
+
+
+def _as_parsed(text: Union[str, ParsedResume]) -> ParsedResume:
+    return text if isinstance(text, ParsedResume) else ParsedResume.from_text(text)
+
+
 class PDFProcessor:
     """
     Advanced PDF processing service for resume analysis.
@@ -13,57 +250,17 @@ class PDFProcessor:
     """
     
     def __init__(self):
-        self.section_patterns = {
-            'contact': [
-                r'contact\s+information',
-                r'personal\s+details',
-                r'contact\s+details'
-            ],
-            'summary': [
-                r'professional\s+summary',
-                r'career\s+summary',
-                r'summary',
-                r'profile',
-                r'objective',
-                r'career\s+objective'
-            ],
-            'experience': [
-                r'work\s+experience',
-                r'professional\s+experience',
-                r'employment\s+history',
-                r'career\s+history',
-                r'experience'
-            ],
-            'education': [
-                r'education',
-                r'academic\s+background',
-                r'educational\s+background',
-                r'qualifications'
-            ],
-            'skills': [
-                r'skills',
-                r'technical\s+skills',
-                r'core\s+competencies',
-                r'competencies',
-                r'expertise'
-            ],
-            'certifications': [
-                r'certifications',
-                r'certificates',
-                r'professional\s+certifications',
-                r'licenses'
-            ],
-            'projects': [
-                r'projects',
-                r'key\s+projects',
-                r'notable\s+projects',
-                r'project\s+experience'
-            ]
-        }
+        self.section_patterns = SECTION_PATTERNS
+        
+        # LRU caches keyed by file content / resume text digest
+        self._text_cache = _LRUCache(_TEXT_CACHE_SIZE)
+        self._structure_cache = _LRUCache(_STRUCTURE_CACHE_SIZE)
     
     def extract_text_from_pdf(self, file_path: str) -> Tuple[str, bool]:
         """
         Extract text from PDF using multiple methods for maximum accuracy.
+        Results are cached by file content, so re-uploads of the same
+        resume (even under a different name) skip parsing.
         
         Args:
             file_path: Path to the PDF file
@@ -72,12 +269,45 @@ class PDFProcessor:
             Tuple of (extracted_text, success_flag)
         """
         try:
-            # Method 1: Try pdfplumber first (better for complex layouts)
+            digest = self._file_digest(file_path)
+        except OSError as e:
+            logger.error(f"Error extracting text from PDF {file_path}: {str(e)}")
+            return "", False
+        
+        cached = self._text_cache.get(digest)
+        if cached is not None:
+            return cached
+        
+        result = self._extract_text_uncached(file_path)
+        self._text_cache.put(digest, result)
+        return result
+    
+    def _file_digest(self, file_path: str) -> bytes:
+        """Hash file contents in chunks."""
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 16), b''):
+                hasher.update(chunk)
+        return hasher.digest()
+    
+    def _extract_text_uncached(self, file_path: str) -> Tuple[str, bool]:
+        """Run the extraction methods in order of preference."""
+        try:
+            # Method 1: Try PDFium first (native, much faster than the pure-Python parsers)
+            if pdfium is not None:
+                try:
+                    text = self._extract_with_pdfium(file_path)
+                    if text and len(text.strip()) > 50:
+                        return text, True
+                except Exception as e:
+                    logger.warning(f"PDFium extraction failed for {file_path}: {str(e)}")
+            
+            # Method 2: Fall back to pdfplumber (better for complex layouts)
             text = self._extract_with_pdfplumber(file_path)
             if text and len(text.strip()) > 50:
                 return text, True
             
-            # Method 2: Fallback to PyPDF2
+            # Method 3: Fallback to PyPDF2
             text = self._extract_with_pypdf2(file_path)
             if text and len(text.strip()) > 50:
                 return text, True
@@ -89,6 +319,24 @@ class PDFProcessor:
             logger.error(f"Error extracting text from PDF {file_path}: {str(e)}")
             return "", False
     
+    def _extract_with_pdfium(self, file_path: str) -> str:
+        """Extract text using PDFium via pypdfium2 (fastest method)."""
+        text_content = []
+        
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                if page_text:
+                    text_content.append(page_text)
+        finally:
+            pdf.close()
+        
+        return '\n'.join(text_content)
+    
     def _extract_with_pdfplumber(self, file_path: str) -> str:
         """Extract text using pdfplumber (preserves layout better)."""
         text_content = []
@@ -96,6 +344,8 @@ class PDFProcessor:
         with pdfplumber.open(file_path) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
+                # Drop the page's parsed layout objects once its text is read
+                page.flush_cache()
                 if page_text:
                     text_content.append(page_text)
         
@@ -114,54 +364,109 @@ class PDFProcessor:
         
         return '\n'.join(text_content)
     
-    def analyze_document_structure(self, text: str) -> Dict[str, any]:
+    def analyze_document_structure(self, text: Union[str, ParsedResume]) -> Dict[str, any]:
         """
         Analyze the structure of the resume document.
         
         Args:
-            text: Extracted text from the resume
+            text: Extracted text from the resume, raw or as a ParsedResume
             
         Returns:
             Dictionary containing structural analysis
         """
-        lines = text.split('\n')
+        # Hand out a copy so callers can't mutate the cached analysis
+        return copy.deepcopy(self._cached_structure(_as_parsed(text)))
+    
+    def _analyze_document_structure(self, doc: ParsedResume, has_email: Optional[bool] = None,
+                                    has_phone: Optional[bool] = None) -> Dict[str, any]:
+        """
+        Uncached implementation of analyze_document_structure. Callers that
+        already scanned for contact details pass has_email/has_phone in.
+        """
+        text = doc.raw
+        lines = doc.lines
+        
+        if has_email is None:
+            has_email = bool(_EMAIL_RE.search(text))
+        if has_phone is None:
+            has_phone = bool(_ANY_PHONE_RE.search(text))
         
         structure = {
             'total_lines': len(lines),
             'sections_found': [],
             'section_boundaries': {},
             'formatting_indicators': {
-                'has_bullet_points': bool(re.search(r'[•·▪▫◦‣⁃]', text)),
-                'has_numbered_lists': bool(re.search(r'^\s*\d+\.', text, re.MULTILINE)),
-                'has_dates': bool(re.search(r'\b\d{4}\b|\b\d{1,2}/\d{4}\b|\b\w+\s+\d{4}\b', text)),
-                'has_email': bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)),
-                'has_phone': bool(re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b|\(\d{3}\)\s*\d{3}[-.]?\d{4}\b', text))
+                'has_bullet_points': _has_bullet_points(text),
+                'has_numbered_lists': _has_numbered_list(lines),
+                'has_dates': bool(_DATE_RE.search(text)),
+                'has_email': has_email,
+                'has_phone': has_phone
             }
         }
         
-        # Identify sections
-        for section_name, patterns in self.section_patterns.items():
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
-                if matches:
-                    structure['sections_found'].append(section_name)
-                    structure['section_boundaries'][section_name] = [
-                        match.start() for match in matches
-                    ]
-                    break
+        # Identify sections. Earlier patterns in a section's list take
+        # precedence, so only positions of the best pattern seen so far are kept.
+        best_hits = {}
+        for start, (section_name, index) in self._section_header_matches(text):
+            best = best_hits.get(section_name)
+            if best is None or index < best[0]:
+                best_hits[section_name] = (index, [start])
+            elif index == best[0]:
+                best[1].append(start)
+        
+        for section_name in self.section_patterns:
+            best = best_hits.get(section_name)
+            if best is not None:
+                structure['sections_found'].append(section_name)
+                structure['section_boundaries'][section_name] = best[1]
         
         return structure
     
-    def extract_contact_information(self, text: str) -> Dict[str, Optional[str]]:
+    def _section_header_matches(self, text: str):
+        """
+        Yield (offset, (section, pattern index)) for every offset where a
+        section pattern matches, taking the first pattern in alternation
+        order when several match at the same offset.
+        """
+        # Hyperscan works on bytes; only ASCII text keeps byte and character
+        # offsets (and case folding) identical to the re path
+        if _SECTION_HS_DB is not None and text.isascii():
+            first_at = {}
+            
+            def on_match(pattern_id, start, end, flags, context):
+                current = first_at.get(start)
+                if current is None or pattern_id < current:
+                    first_at[start] = pattern_id
+            
+            _SECTION_HS_DB.scan(
+                text.encode('ascii'),
+                match_event_handler=on_match,
+                scratch=_hs_scratch()
+            )
+            for start in sorted(first_at):
+                yield start, _SECTION_IDS[first_at[start]]
+            return
+        
+        for match in _SECTION_MASTER_RE.finditer(text):
+            yield match.start(), _SECTION_GROUPS[match.lastgroup]
+    
+    def extract_contact_information(self, text: Union[str, ParsedResume]) -> Dict[str, Optional[str]]:
         """
         Extract contact information from resume text.
         
         Args:
-            text: Resume text
+            text: Resume text, raw or as a ParsedResume
             
         Returns:
             Dictionary with contact information
         """
+        return self._extract_contact_information(_as_parsed(text))[0]
+    
+    def _extract_contact_information(self, doc: ParsedResume) -> Tuple[Dict[str, Optional[str]], bool]:
+        """
+        Contact details plus whether the text matches _ANY_PHONE_RE, which
+        falls out of the phone search for free.
+        """
         contact_info = {
             'name': None,
             'email': None,
@@ -171,64 +476,98 @@ class PDFProcessor:
             'github': None
         }
         
+        text = doc.raw
+        lowered = doc.lower
+        
+        # Literal anchors every match must contain; skip scans that cannot succeed.
+        # ('i' is left out of the lowered anchors: re.IGNORECASE also matches 'ı'/'İ')
+        
         # Extract email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        email_match = _EMAIL_RE.search(text) if '@' in text else None
         if email_match:
             contact_info['email'] = email_match.group()
         
-        # Extract phone number
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            r'\(\d{3}\)\s*\d{3}[-.]?\d{4}\b',
-            r'\+\d{1,3}\s*\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        ]
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
+        # Extract phone number. _ANY_PHONE_RE is the first two patterns, so
+        # it matches exactly when one of them did.
+        has_any_phone = False
+        for i, pattern in enumerate(_PHONE_RES):
+            phone_match = pattern.search(text)
             if phone_match:
                 contact_info['phone'] = phone_match.group()
+                has_any_phone = i < 2
                 break
         
         # Extract LinkedIn profile
-        linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
+        linkedin_match = _LINKEDIN_RE.search(text) if 'nkedin.com/' in lowered else None
         if linkedin_match:
             contact_info['linkedin'] = linkedin_match.group()
         
         # Extract GitHub profile
-        github_match = re.search(r'github\.com/[\w-]+', text, re.IGNORECASE)
+        github_match = _GITHUB_RE.search(text) if 'thub.com/' in lowered else None
         if github_match:
             contact_info['github'] = github_match.group()
         
         # Extract name (heuristic: first line that looks like a name)
-        lines = text.split('\n')
-        for line in lines[:5]:  # Check first 5 lines
+        for line in doc.lines[:5]:  # Check first 5 lines
             line = line.strip()
-            if line and len(line.split()) >= 2 and len(line.split()) <= 4:
-                # Check if it looks like a name (no numbers, reasonable length)
-                if not re.search(r'\d', line) and 5 <= len(line) <= 50:
-                    # Avoid common header words
-                    avoid_words = ['resume', 'cv', 'curriculum', 'vitae', 'contact', 'information']
-                    if not any(word in line.lower() for word in avoid_words):
-                        contact_info['name'] = line
-                        break
-        
-        return contact_info
+            # Looks like a name: 2-4 words, reasonable length, no numbers or header words
+            if 2 <= len(line.split()) <= 4 and 5 <= len(line) <= 50 and not _NAME_REJECT.search(line):
+                contact_info['name'] = line
+                break
+        
+        return contact_info, has_any_phone
     
-    def extract_sections(self, text: str) -> Dict[str, str]:
+    def extract_sections(self, text: Union[str, ParsedResume]) -> Dict[str, str]:
         """
         Extract content from different resume sections.
         
         Args:
-            text: Resume text
+            text: Resume text, raw or as a ParsedResume
             
         Returns:
             Dictionary with section content
         """
+        doc = _as_parsed(text)
+        return self._sections_from_structure(doc, self._cached_structure(doc))
+    
+    def analyze_all(self, text: Union[str, ParsedResume]) -> Tuple[Dict[str, any], Dict[str, Optional[str]], Dict[str, str]]:
+        """
+        Structure, contact information and sections in one pass: the
+        structure is computed (or fetched from the cache) once, and the
+        email/phone scans are shared with the contact extraction.
+        
+        Args:
+            text: Resume text, raw or as a ParsedResume
+            
+        Returns:
+            (document_structure, contact_information, sections), as the
+            three separate methods would return them
+        """
+        doc = _as_parsed(text)
+        contact_info, has_any_phone = self._extract_contact_information(doc)
+        
+        structure = self._cached_structure(
+            doc, has_email=contact_info['email'] is not None, has_phone=has_any_phone
+        )
+        sections = self._sections_from_structure(doc, structure)
+        return copy.deepcopy(structure), contact_info, sections
+    
+    def _cached_structure(self, doc: ParsedResume, **hints) -> Dict[str, any]:
+        """Cached structure analysis; callers must not mutate the result."""
+        cached = self._structure_cache.get(doc.digest)
+        if cached is None:
+            cached = self._analyze_document_structure(doc, **hints)
+            self._structure_cache.put(doc.digest, cached)
+        return cached
+    
+    def _sections_from_structure(self, doc: ParsedResume, structure: Dict[str, any]) -> Dict[str, str]:
+        """Cut the text into sections at the boundaries found by the structure pass."""
         sections = {}
-        structure = self.analyze_document_structure(text)
+        text = doc.raw
         
         # If no clear sections found, try to extract based on common patterns
         if not structure['sections_found']:
-            return self._extract_sections_heuristic(text)
+            return self._extract_sections_heuristic(doc)
         
         # Extract sections based on identified boundaries
         text_length = len(text)
@@ -253,33 +592,33 @@ class PDFProcessor:
         
         return sections
     
-    def _extract_sections_heuristic(self, text: str) -> Dict[str, str]:
+    def _extract_sections_heuristic(self, doc: ParsedResume) -> Dict[str, str]:
         """
         Extract sections using heuristic methods when clear boundaries aren't found.
         """
         sections = {}
-        lines = text.split('\n')
+        lines = doc.lines
         
-        # Try to identify experience section by looking for date patterns
+        # Try to identify experience section by looking for date patterns.
+        # Scan the whole text once and map each match back to its line.
         experience_lines = []
-        for i, line in enumerate(lines):
-            if re.search(r'\b\d{4}\b.*\b\d{4}\b|\b\d{4}\b.*present', line, re.IGNORECASE):
-                # Found a line with date range, likely experience
-                start_idx = max(0, i - 2)
-                end_idx = min(len(lines), i + 5)
-                experience_lines.extend(lines[start_idx:end_idx])
+        last_line = -1
+        for match in _DATE_RANGE_RE.finditer(doc.raw):
+            i = doc.line_index(match.start())
+            if i == last_line:
+                continue
+            last_line = i
+            # Found a line with date range, likely experience
+            start_idx = max(0, i - 2)
+            end_idx = min(len(lines), i + 5)
+            experience_lines.extend(lines[start_idx:end_idx])
         
         if experience_lines:
             sections['experience'] = '\n'.join(experience_lines)
         
         # Try to identify skills section by looking for technical terms
-        skill_keywords = ['python', 'java', 'javascript', 'sql', 'aws', 'docker', 'kubernetes', 
-                         'react', 'angular', 'vue', 'node', 'spring', 'django', 'flask']
-        
-        skills_lines = []
-        for line in lines:
-            if any(keyword in line.lower() for keyword in skill_keywords):
-                skills_lines.append(line)
+        skills_lines = [line for line, line_lower in zip(lines, doc.lines_lower)
+                        if _has_skill_keyword(line_lower)]
         
         if skills_lines:
             sections['skills'] = '\n'.join(skills_lines)
@@ -305,13 +644,17 @@ class PDFProcessor:
         }
         
         try:
-            # Check file size (limit to 10MB)
-            import os
-            file_size = os.path.getsize(file_path)
-            validation['file_size_ok'] = file_size <= 10 * 1024 * 1024
-            
-            # Check PDF structure
             with open(file_path, 'rb') as file:
+                # Check file size (limit to 10MB) on the open descriptor
+                file_size = os.fstat(file.fileno()).st_size
+                validation['file_size_ok'] = file_size <= _MAX_PDF_SIZE
+                
+                # Don't spend a full parse on files we'd reject anyway
+                if not validation['file_size_ok']:
+                    validation['error_message'] = "File exceeds the 10MB size limit"
+                    return validation
+                
+                # Check PDF structure
                 pdf_reader = PyPDF2.PdfReader(file)
                 
                 validation['is_encrypted'] = pdf_reader.is_encrypted
@@ -1,15 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, Response
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from typing import Dict, Optional
+from fastapi.responses import FileResponse, ORJSONResponse
+from sqlalchemy.orm import Session, joinedload
+from typing import Dict, Optional, Tuple
 import os
+import time
 import uuid
+import asyncio
+import threading
 import json
 import logging
 from datetime import datetime, timedelta
 
 from app.db.session import get_db
-from app.models.database import User, Assessment, Candidate, JobDescription
+from app.models.database import User, Assessment
 from app.models.schemas import (
     ReportRequest,
     ReportResponse,
@@ -19,7 +22,7 @@ from app.api.auth import get_current_active_user
 from app.services.assessment_engine import AssessmentEngine
 from app.services.report_generator import ReportGenerator
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 # Initialize services
@@ -30,6 +33,112 @@ report_generator = ReportGenerator()
 REPORTS_DIR = "generated_reports"
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
+# Manifest of generated reports so downloads don't probe the filesystem
+REPORT_INDEX_PATH = os.path.join(REPORTS_DIR, ".report_index.jsonl")
+REPORT_MEDIA_TYPES = {
+    '.pdf': 'application/pdf',
+    '.html': 'text/html',
+    '.json': 'application/json'
+}
+
+def _report_entry(report_id: str, file_path: str) -> Tuple[str, str, str]:
+    """Build the (path, media_type, filename) index entry for a report file."""
+    ext = os.path.splitext(file_path)[1]
+    media_type = REPORT_MEDIA_TYPES.get(ext, 'application/octet-stream')
+    return file_path, media_type, f"assessment_report_{report_id}{ext}"
+
+def _load_report_index() -> Dict[str, Tuple[str, str, str]]:
+    """Replay the manifest file; later lines win."""
+    index = {}
+    try:
+        with open(REPORT_INDEX_PATH, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    report_id, file_path = json.loads(line)
+                except (ValueError, TypeError):
+                    continue
+                index[report_id] = _report_entry(report_id, file_path)
+    except OSError:
+        pass
+    return index
+
+_report_index = _load_report_index()
+_report_index_lock = threading.Lock()
+
+def _register_report(report_id: str, file_path: str) -> None:
+    """Record a generated report in memory and append it to the manifest."""
+    with _report_index_lock:
+        _report_index[report_id] = _report_entry(report_id, file_path)
+        try:
+            with open(REPORT_INDEX_PATH, 'a', encoding='utf-8') as f:
+                f.write(json.dumps([report_id, file_path]) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not persist report index entry: {str(e)}")
+
+def _rewrite_report_index() -> None:
+    """Compact the manifest to the current in-memory index (caller holds the lock)."""
+    tmp_path = REPORT_INDEX_PATH + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for report_id, (file_path, _, _) in _report_index.items():
+            f.write(json.dumps([report_id, file_path]) + "\n")
+    os.replace(tmp_path, REPORT_INDEX_PATH)
+
+def _find_report(report_id: str) -> Optional[Tuple[str, str, str]]:
+    """Look up a report, probing the directory only for unindexed ids."""
+    entry = _report_index.get(report_id)
+    if entry is not None:
+        return entry
+    
+    for ext in REPORT_MEDIA_TYPES:
+        potential_path = os.path.join(REPORTS_DIR, f"{report_id}{ext}")
+        if os.path.exists(potential_path):
+            return _report_entry(report_id, potential_path)
+    
+    return None
+
+def _get_assessment_with_relations(db: Session, assessment_id: int) -> Optional[Assessment]:
+    """Load an assessment with its candidate and job description in one query."""
+    return (
+        db.query(Assessment)
+        .options(joinedload(Assessment.candidate), joinedload(Assessment.job_description))
+        .filter(Assessment.id == assessment_id)
+        .first()
+    )
+
+def _remove_expired_reports(max_age: timedelta) -> int:
+    """Delete report files older than max_age; returns the number removed."""
+    if not os.path.exists(REPORTS_DIR):
+        return 0
+    
+    cutoff = time.time() - max_age.total_seconds()
+    expired = []
+    
+    # DirEntry caches the directory listing's file type; stat() is one call per entry
+    with os.scandir(REPORTS_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith(".report_index"):
+                continue
+            if entry.is_file() and entry.stat().st_ctime < cutoff:
+                expired.append(entry.path)
+    
+    if not expired:
+        return 0
+    
+    # Drop the index entries and the files under one lock, so a download
+    # never finds an entry whose file is already gone
+    removed = set(expired)
+    with _report_index_lock:
+        for report_id in [rid for rid, entry in _report_index.items() if entry[0] in removed]:
+            del _report_index[report_id]
+        for file_path in expired:
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+        _rewrite_report_index()
+    
+    return len(expired)
+
 @router.post("/generate", response_model=ReportResponse)
 async def generate_assessment_report(
     report_request: ReportRequest,
@@ -38,14 +147,13 @@ async def generate_assessment_report(
 ):
     """Generate a comprehensive assessment report."""
     
-    # Get assessment
-    assessment = db.query(Assessment).filter(Assessment.id == report_request.assessment_id).first()
+    # Get assessment together with its related data
+    assessment = _get_assessment_with_relations(db, report_request.assessment_id)
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
     
-    # Get related data
-    candidate = db.query(Candidate).filter(Candidate.id == assessment.candidate_id).first()
-    job_description = db.query(JobDescription).filter(JobDescription.id == assessment.job_description_id).first()
+    candidate = assessment.candidate
+    job_description = assessment.job_description
     
     if not candidate or not job_description:
         raise HTTPException(status_code=404, detail="Related data not found")
@@ -106,6 +214,7 @@ async def generate_assessment_report(
             
             assessment.status = "completed"
             assessment.completed_at = datetime.utcnow()
+            assessment.refresh_summary_json()
             
             db.commit()
             db.refresh(assessment)
@@ -174,6 +283,8 @@ async def generate_assessment_report(
         else:
             raise HTTPException(status_code=400, detail="Unsupported report format")
         
+        _register_report(report_id, file_path)
+        
         # Set expiration (reports expire after 7 days)
         expires_at = datetime.utcnow() + timedelta(days=7)
         
@@ -198,37 +309,24 @@ async def download_report(
 ):
     """Download a generated report."""
     
-    # Find report file
-    possible_extensions = ['.pdf', '.html', '.json']
-    file_path = None
-    
-    for ext in possible_extensions:
-        potential_path = os.path.join(REPORTS_DIR, f"{report_id}{ext}")
-        if os.path.exists(potential_path):
-            file_path = potential_path
-            break
-    
-    if not file_path:
-        raise HTTPException(status_code=404, detail="Report not found")
-    
-    # Determine media type
-    if file_path.endswith('.pdf'):
-        media_type = 'application/pdf'
-        filename = f"assessment_report_{report_id}.pdf"
-    elif file_path.endswith('.html'):
-        media_type = 'text/html'
-        filename = f"assessment_report_{report_id}.html"
-    elif file_path.endswith('.json'):
-        media_type = 'application/json'
-        filename = f"assessment_report_{report_id}.json"
-    else:
-        media_type = 'application/octet-stream'
-        filename = f"assessment_report_{report_id}"
+    # Find and stat the report under the index lock, so the expiry sweep
+    # can't remove it in between; Starlette reuses the stat for headers
+    with _report_index_lock:
+        entry = _find_report(report_id)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Report not found")
+        
+        file_path, media_type, filename = entry
+        try:
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Report not found")
     
     return FileResponse(
         path=file_path,
         media_type=media_type,
-        filename=filename
+        filename=filename,
+        stat_result=stat_result
     )
 
 @router.get("/assessment/{assessment_id}/summary", response_model=Dict)
@@ -239,33 +337,16 @@ async def get_assessment_summary(
 ):
     """Get assessment summary without generating full report."""
     
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = _get_assessment_with_relations(db, assessment_id)
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
     
-    candidate = db.query(Candidate).filter(Candidate.id == assessment.candidate_id).first()
-    job_description = db.query(JobDescription).filter(JobDescription.id == assessment.job_description_id).first()
+    # Completed assessments carry a pre-serialized summary, cleared by the
+    # model whenever the assessment, candidate name or job title changes
+    if assessment.summary_json:
+        return Response(content=assessment.summary_json, media_type="application/json")
     
-    return {
-        'assessment_id': assessment.id,
-        'candidate_name': candidate.name if candidate else 'Unknown',
-        'job_title': job_description.title if job_description else 'Unknown',
-        'overall_score': assessment.overall_score,
-        'confidence_level': assessment.confidence_level,
-        'hiring_recommendation': assessment.hiring_recommendation,
-        'status': assessment.status,
-        'component_scores': {
-            'resume_analysis': assessment.resume_analysis_score,
-            'skill_match': assessment.skill_match_score,
-            'experience_relevance': assessment.experience_relevance_score,
-            'interview_performance': assessment.interview_performance_score,
-            'cultural_fit': assessment.cultural_fit_score
-        },
-        'strengths': assessment.get_strengths()[:3],  # Top 3 strengths
-        'development_areas': assessment.get_development_areas()[:3],  # Top 3 areas
-        'created_at': assessment.created_at,
-        'completed_at': assessment.completed_at
-    }
+    return assessment.build_summary()
 
 @router.get("/assessment/{assessment_id}/detailed", response_model=Dict)
 async def get_detailed_assessment(
@@ -275,12 +356,12 @@ async def get_detailed_assessment(
 ):
     """Get detailed assessment data."""
     
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = _get_assessment_with_relations(db, assessment_id)
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
     
-    candidate = db.query(Candidate).filter(Candidate.id == assessment.candidate_id).first()
-    job_description = db.query(JobDescription).filter(JobDescription.id == assessment.job_description_id).first()
+    candidate = assessment.candidate
+    job_description = assessment.job_description
     
     return {
         'assessment': {
@@ -336,18 +417,8 @@ async def cleanup_expired_reports(
         raise HTTPException(status_code=403, detail="Admin access required")
     
     try:
-        cleaned_count = 0
-        
-        # Get all files in reports directory
-        if os.path.exists(REPORTS_DIR):
-            for filename in os.listdir(REPORTS_DIR):
-                file_path = os.path.join(REPORTS_DIR, filename)
-                
-                # Check file age (remove files older than 7 days)
-                file_age = datetime.utcnow() - datetime.fromtimestamp(os.path.getctime(file_path))
-                if file_age > timedelta(days=7):
-                    os.remove(file_path)
-                    cleaned_count += 1
+        # Remove files older than 7 days off the event loop
+        cleaned_count = await asyncio.to_thread(_remove_expired_reports, timedelta(days=7))
         
         return APIResponse(
             success=True,
@@ -1,163 +1,250 @@
 import os
-import json
+import re
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
-from datetime import datetime
-from jinja2 import Template
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+import orjson
+from jinja2 import Environment, DictLoader, FileSystemBytecodeCache
+from markupsafe import escape
 import weasyprint
 from weasyprint import HTML, CSS
 
 logger = logging.getLogger(__name__)
 
-class ReportGenerator:
+# Compiled template bytecode shared across restarts and worker processes
+JINJA_BC_DIR = os.environ.get("JINJA_BC_DIR", "/var/cache/reports/jinja")
+
+# Decoded images kept per render worker for reuse across documents
+PDF_IMAGE_CACHE_SIZE = int(os.environ.get("PDF_IMAGE_CACHE_SIZE", "64"))
+
+# JPEG quality used when re-encoding embedded images
+PDF_JPEG_QUALITY = 80
+
+# orjson serializes datetimes itself; naive ones are written as UTC.
+# Non-str keys are stringified, as json.dump does
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+)
+
+# Number of rendered HTML documents kept per generator
+_HTML_CACHE_SIZE = 256
+
+# Report stylesheet; inlined into HTML reports, parsed once per process for PDFs
+REPORT_CSS = """
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 20px;
+}
+.header {
+    text-align: center;
+    border-bottom: 3px solid #2c3e50;
+    padding-bottom: 20px;
+    margin-bottom: 30px;
+}
+.header h1 {
+    color: #2c3e50;
+    margin: 0;
+    font-size: 2.5em;
+}
+.header .subtitle {
+    color: #7f8c8d;
+    font-size: 1.2em;
+    margin-top: 10px;
+}
+.section {
+    margin-bottom: 30px;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.section h2 {
+    color: #2c3e50;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 10px;
+    margin-top: 0;
+}
+.score-container {
+    display: flex;
+    justify-content: space-between;
+    flex-wrap: wrap;
+    gap: 15px;
+    margin: 20px 0;
+}
+.score-item {
+    flex: 1;
+    min-width: 200px;
+    text-align: center;
+    padding: 15px;
+    border-radius: 8px;
+    background: #f8f9fa;
+}
+.score-value {
+    font-size: 2em;
+    font-weight: bold;
+    margin: 10px 0;
+}
+.score-excellent { color: #27ae60; }
+.score-good { color: #f39c12; }
+.score-fair { color: #e67e22; }
+.score-poor { color: #e74c3c; }
+.recommendation {
+    padding: 20px;
+    border-radius: 8px;
+    margin: 20px 0;
+    font-weight: bold;
+    text-align: center;
+    font-size: 1.2em;
+}
+.recommendation.strong-hire {
+    background: #d4edda;
+    color: #155724;
+    border: 1px solid #c3e6cb;
+}
+.recommendation.hire {
+    background: #d1ecf1;
+    color: #0c5460;
+    border: 1px solid #bee5eb;
+}
+.recommendation.maybe {
+    background: #fff3cd;
+    color: #856404;
+    border: 1px solid #ffeaa7;
+}
+.recommendation.no-hire {
+    background: #f8d7da;
+    color: #721c24;
+    border: 1px solid #f5c6cb;
+}
+.list-item {
+    margin: 10px 0;
+    padding: 10px;
+    background: #f8f9fa;
+    border-left: 4px solid #3498db;
+    border-radius: 4px;
+}
+.metadata {
+    background: #f8f9fa;
+    padding: 15px;
+    border-radius: 8px;
+    font-size: 0.9em;
+    color: #6c757d;
+    margin-top: 30px;
+}
+.two-column {
+    display: flex;
+    gap: 20px;
+}
+.column {
+    flex: 1;
+}
+@media (max-width: 768px) {
+    .two-column,
+    .score-container {
+        flex-direction: column;
+    }
+}
+@media print {
+    body { margin: 0; padding: 15px; }
+    .section { break-inside: avoid; }
+}
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Drop comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+# Compact form actually shipped in HTML reports and fed to WeasyPrint
+_MINIFIED_CSS = _minify_css(REPORT_CSS)
+
+
+@lru_cache(maxsize=1)
+def _report_stylesheet() -> CSS:
+    """Parsed report stylesheet, built once per (worker) process."""
+    return CSS(string=_MINIFIED_CSS)
+
+
+class _ImageCache(OrderedDict):
     """
-    Service for generating assessment reports in various formats.
+    LRU mapping for WeasyPrint's image cache (it accepts any dict): images
+    shared between reports are decoded once per worker, and the oldest
+    entries are dropped instead of growing without bound.
     """
     
-    def __init__(self):
-        self.templates_dir = "app/templates"
-        os.makedirs(self.templates_dir, exist_ok=True)
-        
-        # Create default templates if they don't exist
-        self._create_default_templates()
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
     
-    def _create_default_templates(self):
-        """Create default report templates."""
-        
-        # HTML template for reports
-        html_template = """
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def _pdf_render_options() -> Dict[str, Any]:
+    """
+    WeasyPrint options for every PDF: deduplicated, recompressed images
+    (same as --optimize-images on the CLI) and a bounded in-memory image
+    cache, one per render worker process.
+    """
+    return {
+        'optimize_images': True,
+        'jpeg_quality': PDF_JPEG_QUALITY,
+        'cache': _ImageCache(PDF_IMAGE_CACHE_SIZE),
+    }
+
+
+# Static document shell around the rendered report body. Only the title
+# varies, so the head is assembled from precomputed strings rather than
+# re-rendered by Jinja for every report.
+_HTML_HEAD_START = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Assessment Report - {{ candidate.name }}</title>
+    <title>Assessment Report - """
+_HTML_HEAD_END = """</title>
+</head>
+<body>"""
+_HTML_HEAD_END_INLINE_CSS = f"""</title>
     <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        .header {
-            text-align: center;
-            border-bottom: 3px solid #2c3e50;
-            padding-bottom: 20px;
-            margin-bottom: 30px;
-        }
-        .header h1 {
-            color: #2c3e50;
-            margin: 0;
-            font-size: 2.5em;
-        }
-        .header .subtitle {
-            color: #7f8c8d;
-            font-size: 1.2em;
-            margin-top: 10px;
-        }
-        .section {
-            margin-bottom: 30px;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .section h2 {
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-            margin-top: 0;
-        }
-        .score-container {
-            display: flex;
-            justify-content: space-between;
-            flex-wrap: wrap;
-            gap: 15px;
-            margin: 20px 0;
-        }
-        .score-item {
-            flex: 1;
-            min-width: 200px;
-            text-align: center;
-            padding: 15px;
-            border-radius: 8px;
-            background: #f8f9fa;
-        }
-        .score-value {
-            font-size: 2em;
-            font-weight: bold;
-            margin: 10px 0;
-        }
-        .score-excellent { color: #27ae60; }
-        .score-good { color: #f39c12; }
-        .score-fair { color: #e67e22; }
-        .score-poor { color: #e74c3c; }
-        .recommendation {
-            padding: 20px;
-            border-radius: 8px;
-            margin: 20px 0;
-            font-weight: bold;
-            text-align: center;
-            font-size: 1.2em;
-        }
-        .recommendation.strong-hire {
-            background: #d4edda;
-            color: #155724;
-            border: 1px solid #c3e6cb;
-        }
-        .recommendation.hire {
-            background: #d1ecf1;
-            color: #0c5460;
-            border: 1px solid #bee5eb;
-        }
-        .recommendation.maybe {
-            background: #fff3cd;
-            color: #856404;
-            border: 1px solid #ffeaa7;
-        }
-        .recommendation.no-hire {
-            background: #f8d7da;
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-        }
-        .list-item {
-            margin: 10px 0;
-            padding: 10px;
-            background: #f8f9fa;
-            border-left: 4px solid #3498db;
-            border-radius: 4px;
-        }
-        .metadata {
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 8px;
-            font-size: 0.9em;
-            color: #6c757d;
-            margin-top: 30px;
-        }
-        .two-column {
-            display: flex;
-            gap: 20px;
-        }
-        .column {
-            flex: 1;
-        }
-        @media (max-width: 768px) {
-            .two-column {
-                flex-direction: column;
-            }
-            .score-container {
-                flex-direction: column;
-            }
-        }
-        @media print {
-            body { margin: 0; padding: 15px; }
-            .section { break-inside: avoid; }
-        }
+{_MINIFIED_CSS}
     </style>
 </head>
-<body>
+<body>"""
+_HTML_TAIL = """
+</body>
+</html>"""
+
+# Report body template, compiled from source rather than a file on disk
+HTML_TEMPLATE_NAME = "assessment_report_body.html"
+HTML_TEMPLATE_SRC = """
     <div class="header">
         <h1>AI Assessment Report</h1>
         <div class="subtitle">Comprehensive Candidate Evaluation</div>
@@ -323,27 +410,97 @@ class ReportGenerator:
         <p><strong>Assessment ID:</strong> {{ assessment.id }}</p>
         <p><em>This report was generated by the AI Interview Assessment Platform. All scores and recommendations are based on automated analysis and should be considered alongside human judgment.</em></p>
     </div>
-</body>
-</html>
-        """
+"""
+
+
+# Worker processes for WeasyPrint rendering, started on first use
+_PDF_RENDER_WORKERS = os.cpu_count() or 1
+_pdf_render_pool: Optional[ProcessPoolExecutor] = None
+_pdf_render_pool_lock = threading.Lock()
+
+
+def _get_pdf_render_pool() -> ProcessPoolExecutor:
+    global _pdf_render_pool
+    with _pdf_render_pool_lock:
+        if _pdf_render_pool is None:
+            _pdf_render_pool = ProcessPoolExecutor(max_workers=_PDF_RENDER_WORKERS)
+        return _pdf_render_pool
+
+
+# Leaf types whose repr() identifies the value and its type exactly
+_DIGEST_LEAF_TYPES = frozenset({str, int, float, bool, type(None), date, datetime, time, Decimal, UUID})
+
+
+def _digestible(value: Any) -> bool:
+    """True if repr(value) is an exact, type-preserving key for rendering."""
+    kind = type(value)
+    if kind in _DIGEST_LEAF_TYPES:
+        return True
+    if kind is dict:
+        return all(_digestible(key) and _digestible(item) for key, item in value.items())
+    if kind is list or kind is tuple:
+        return all(_digestible(item) for item in value)
+    if isinstance(value, Enum):
+        return _digestible(value.value)
+    return False
+
+
+def _render_pdf(html_content: str, pdf_path: str) -> None:
+    """Render HTML to a PDF file (runs in a worker process)."""
+    HTML(string=html_content).write_pdf(
+        pdf_path, stylesheets=[_report_stylesheet()], **_pdf_render_options()
+    )
+
+
+def _html_title(report_data: Dict[str, Any]) -> str:
+    """Escaped candidate name for the document title."""
+    return escape(report_data.get('candidate', {}).get('name', ''))
+
+
+class ReportGenerator:
+    """
+    Service for generating assessment reports in various formats.
+    """
+    
+    def __init__(self):
+        # Parse and compile the report template once; renders reuse it.
+        # The source ships with the module, so startup writes no files.
+        self._env = Environment(
+            loader=DictLoader({HTML_TEMPLATE_NAME: HTML_TEMPLATE_SRC}),
+            autoescape=True,
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=self._create_bytecode_cache()
+        )
+        self._template = self._env.get_template(HTML_TEMPLATE_NAME)
         
-        html_template_path = os.path.join(self.templates_dir, "assessment_report.html")
-        if not os.path.exists(html_template_path):
-            with open(html_template_path, 'w', encoding='utf-8') as f:
-                f.write(html_template)
+        # Rendered report bodies keyed by a digest of the report data
+        self._html_cache = OrderedDict()
+        self._html_cache_lock = threading.Lock()
+    
+    def _create_bytecode_cache(self):
+        """On-disk Jinja bytecode cache, or None if the directory is unusable."""
+        try:
+            os.makedirs(JINJA_BC_DIR, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Jinja bytecode cache disabled ({JINJA_BC_DIR}): {str(e)}")
+            return None
+        return FileSystemBytecodeCache(directory=JINJA_BC_DIR)
     
     async def generate_pdf_report(self, report_data: Dict[str, Any], report_id: str, output_dir: str) -> str:
         """Generate PDF report from assessment data."""
         try:
             # First generate HTML
-            html_content = await self._generate_html_content(report_data)
+            html_content = await self._generate_html_content(report_data, inline_css=False)
             
             # Convert HTML to PDF
             pdf_path = os.path.join(output_dir, f"{report_id}.pdf")
             
-            # Create PDF with WeasyPrint
-            html_doc = HTML(string=html_content)
-            html_doc.write_pdf(pdf_path)
+            # Create PDF with WeasyPrint off the event loop; rendering is
+            # CPU-bound, so use worker processes rather than threads
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_get_pdf_render_pool(), _render_pdf, html_content, pdf_path)
             
             logger.info(f"PDF report generated: {pdf_path}")
             return pdf_path
@@ -373,11 +530,9 @@ class ReportGenerator:
         try:
             json_path = os.path.join(output_dir, f"{report_id}.json")
             
-            # Convert datetime objects to strings for JSON serialization
-            json_data = self._prepare_json_data(report_data)
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            # Encode straight to UTF-8 bytes, no intermediate str
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(report_data, option=_ORJSON_OPTIONS))
             
             logger.info(f"JSON report generated: {json_path}")
             return json_path
@@ -386,28 +541,50 @@ class ReportGenerator:
             logger.error(f"Error generating JSON report: {str(e)}")
             raise
     
-    async def _generate_html_content(self, report_data: Dict[str, Any]) -> str:
-        """Generate HTML content from report data."""
-        template_path = os.path.join(self.templates_dir, "assessment_report.html")
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+    async def _generate_html_content(self, report_data: Dict[str, Any], inline_css: bool = True) -> str:
+        """
+        Generate HTML content from report data. PDF rendering passes
+        inline_css=False and applies the cached stylesheet instead.
+        """
+        head_end = _HTML_HEAD_END_INLINE_CSS if inline_css else _HTML_HEAD_END
+        return ''.join((
+            _HTML_HEAD_START, _html_title(report_data), head_end,
+            self._render_body(report_data),
+            _HTML_TAIL
+        ))
+    
+    def _render_body(self, report_data: Dict[str, Any]) -> str:
+        """Render the report body, reusing a cached render for identical data."""
+        key = self._report_digest(report_data)
+        if key is not None:
+            with self._html_cache_lock:
+                body = self._html_cache.get(key)
+                if body is not None:
+                    self._html_cache.move_to_end(key)
+                    return body
         
-        template = Template(template_content)
+        # Render the precompiled template with data
+        body = self._template.render(**report_data)
         
-        # Render template with data
-        html_content = template.render(**report_data)
+        if key is not None:
+            with self._html_cache_lock:
+                self._html_cache[key] = body
+                while len(self._html_cache) > _HTML_CACHE_SIZE:
+                    self._html_cache.popitem(last=False)
         
-        return html_content
+        return body
     
-    def _prepare_json_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare data for JSON serialization by converting datetime objects."""
-        if isinstance(data, dict):
-            return {key: self._prepare_json_data(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._prepare_json_data(item) for item in data]
-        elif isinstance(data, datetime):
-            return data.isoformat()
-        else:
-            return data
+    def _report_digest(self, report_data: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Digest of the render inputs, or None if they can't be keyed exactly.
+        repr() keeps what a JSON encoding would merge: 1 vs "1" keys, tuple
+        vs list, datetime vs its ISO string, Enum vs value, and dict order
+        (the template iterates .items()).
+        """
+        if not _digestible(report_data):
+            # e.g. an arbitrary object whose repr is its identity: render
+            # uncached rather than risk a key collision
+            return None
+        
+        return hashlib.blake2b(repr(report_data).encode('utf-8'), digest_size=16).digest()
 
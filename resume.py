@@ -1,116 +1,203 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+import io
 import os
 import time
 import uuid
+import asyncio
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-from app.db.session import get_db
+from app.db.session import get_db, get_async_or_sync_db
 from app.models.database import User, Candidate
 from app.models.schemas import (
     Candidate as CandidateSchema, 
     CandidateCreate, 
     CandidateUpdate,
     ResumeAnalysisResult,
-    APIResponse
+    APIResponse,
+    CandidateListItem,
+    LIST_JSON_ENCODER,
+    from_orm_fast
 )
 from app.api.auth import get_current_active_user
-from app.services.pdf_processor import PDFProcessor
-from app.services.nlp_analyzer import NLPAnalyzer
+from app.services.pdf_processor import PDFProcessor, ParsedResume
+from app.services.nlp_analyzer import get_analyzer
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 # Initialize services
 pdf_processor = PDFProcessor()
-nlp_analyzer = NLPAnalyzer()
+nlp_analyzer = get_analyzer()
 
 # File upload configuration
 UPLOAD_DIR = "uploads/resumes"
-ALLOWED_EXTENSIONS = {".pdf", ".doc", ".docx"}
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".doc", ".docx"})
+_ALLOWED_EXT_NAMES = frozenset(ext[1:] for ext in ALLOWED_EXTENSIONS)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 # Ensure upload directory exists
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Worker processes for resume analysis (PDF parsing + NLP), started on first use
+_RESUME_POOL_WORKERS = os.cpu_count() or 1
+_resume_pool: Optional[ProcessPoolExecutor] = None
+_resume_pool_lock = threading.Lock()
+
+def _init_resume_worker():
+    """Load the NLP models (or connect to the analyzer server) before taking work."""
+    get_analyzer()
+
+def _get_resume_pool() -> ProcessPoolExecutor:
+    global _resume_pool
+    with _resume_pool_lock:
+        if _resume_pool is None:
+            # Spawned, not forked: a fork would copy the server's event loop,
+            # threads and held locks into the worker; the initializer loads
+            # the models fresh instead
+            _resume_pool = ProcessPoolExecutor(
+                max_workers=_RESUME_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_resume_worker
+            )
+        return _resume_pool
+
 def validate_file(file: UploadFile) -> bool:
     """Validate uploaded file."""
     # Check file extension
-    file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in ALLOWED_EXTENSIONS:
+    _, dot, file_ext = (file.filename or "").rpartition('.')
+    if not dot or file_ext.lower() not in _ALLOWED_EXT_NAMES:
         return False
     
     # Check file size (this is approximate, actual size check happens during upload)
     return True
 
-def save_uploaded_file(file: UploadFile) -> str:
+def _upload_fileno(upload) -> Optional[int]:
+    """
+    File descriptor behind the upload, or None if it has none (e.g. an
+    in-memory buffer). A spooled upload still in memory is rolled over to
+    its temp file by fileno(); that costs at most the spool size.
+    """
+    try:
+        return upload.fileno()
+    except (AttributeError, io.UnsupportedOperation, OSError):
+        return None
+
+def _copy_upload(upload, file_path: str, limit: int) -> int:
+    """
+    Copy at most limit bytes of the upload to file_path and return the
+    number copied. Uses sendfile when the upload is a real file, so the
+    data never passes through Python; otherwise large read/write chunks.
+    """
+    copied = 0
+    with open(file_path, "wb") as buffer:
+        in_fd = _upload_fileno(upload)
+        if in_fd is not None:
+            try:
+                while copied < limit:
+                    sent = os.sendfile(buffer.fileno(), in_fd, copied, limit - copied)
+                    if not sent:
+                        return copied
+                    copied += sent
+                return copied
+            except OSError:
+                if copied:
+                    raise
+                # sendfile unsupported for this pair of files
+        
+        while copied < limit:
+            chunk = upload.read(min(UPLOAD_CHUNK_SIZE, limit - copied))
+            if not chunk:
+                break
+            buffer.write(chunk)
+            copied += len(chunk)
+    return copied
+
+async def save_uploaded_file(file: UploadFile) -> str:
     """Save uploaded file and return the file path."""
     # Generate unique filename
     file_ext = os.path.splitext(file.filename)[1].lower()
     unique_filename = f"{uuid.uuid4()}{file_ext}"
     file_path = os.path.join(UPLOAD_DIR, unique_filename)
     
-    # Save file
-    with open(file_path, "wb") as buffer:
-        content = file.file.read()
-        if len(content) > MAX_FILE_SIZE:
-            os.remove(file_path) if os.path.exists(file_path) else None
-            raise HTTPException(status_code=413, detail="File too large")
-        buffer.write(content)
+    # Copy in one worker-thread call; reading one byte past the limit is
+    # enough to tell that the upload is too large
+    size = await asyncio.to_thread(_copy_upload, file.file, file_path, MAX_FILE_SIZE + 1)
+    
+    if size > MAX_FILE_SIZE:
+        os.remove(file_path)
+        raise HTTPException(status_code=413, detail="File too large")
     
     return file_path
 
-def process_resume(file_path: str, candidate_data: dict) -> dict:
-    """Process resume and extract information."""
+def _analyze_resume(file_path: str) -> dict:
+    """Extract and analyze a resume. Runs in-process or in a worker process."""
     start_time = time.time()
     
+    # Extract text from PDF
+    resume_text, extraction_success = pdf_processor.extract_text_from_pdf(file_path)
+    
+    if not extraction_success:
+        logger.warning(f"Limited text extraction from {file_path}")
+    
+    # Split and lowercase the text once for all extractors
+    parsed_resume = ParsedResume.from_text(resume_text)
+    
+    # Document structure, contact information and sections in one pass
+    document_structure, contact_info, sections = pdf_processor.analyze_all(parsed_resume)
+    
+    # Perform NLP analysis; the three passes share one spaCy parse
+    extracted_skills, extracted_experience, extracted_education = nlp_analyzer.analyze_resume_text(
+        resume_text, parsed_resume.lower
+    )
+    
+    processing_time = time.time() - start_time
+    
+    return {
+        'analysis_success': extraction_success,
+        'resume_text': resume_text,
+        'extracted_skills': extracted_skills,
+        'extracted_experience': extracted_experience,
+        'extracted_education': extracted_education,
+        'contact_information': contact_info,
+        'document_structure': document_structure,
+        'sections': sections,
+        'processing_time_seconds': round(processing_time, 2)
+    }
+
+def _reanalyze_text(resume_text: str) -> tuple:
+    """NLP passes over stored resume text. Runs in a worker process."""
+    return nlp_analyzer.analyze_resume_text(resume_text)
+
+def _fill_missing_contact(candidate_data: dict, contact_info: dict) -> None:
+    """Update contact info with extracted data if not provided."""
+    if not candidate_data.get('name') and contact_info.get('name'):
+        candidate_data['name'] = contact_info['name']
+    if not candidate_data.get('email') and contact_info.get('email'):
+        candidate_data['email'] = contact_info['email']
+    if not candidate_data.get('phone') and contact_info.get('phone'):
+        candidate_data['phone'] = contact_info['phone']
+
+async def process_resume_async(file_path: str, candidate_data: dict) -> dict:
+    """Process resume in the worker pool so uploads run in parallel across cores."""
+    loop = asyncio.get_running_loop()
     try:
-        # Extract text from PDF
-        resume_text, extraction_success = pdf_processor.extract_text_from_pdf(file_path)
-        
-        if not extraction_success:
-            logger.warning(f"Limited text extraction from {file_path}")
-        
-        # Analyze document structure
-        document_structure = pdf_processor.analyze_document_structure(resume_text)
-        
-        # Extract contact information
-        contact_info = pdf_processor.extract_contact_information(resume_text)
-        
-        # Extract sections
-        sections = pdf_processor.extract_sections(resume_text)
-        
-        # Perform NLP analysis
-        extracted_skills = nlp_analyzer.extract_skills(resume_text)
-        extracted_experience = nlp_analyzer.analyze_experience(resume_text)
-        extracted_education = nlp_analyzer.analyze_education(resume_text)
-        
-        # Update contact info with extracted data if not provided
-        if not candidate_data.get('name') and contact_info.get('name'):
-            candidate_data['name'] = contact_info['name']
-        if not candidate_data.get('email') and contact_info.get('email'):
-            candidate_data['email'] = contact_info['email']
-        if not candidate_data.get('phone') and contact_info.get('phone'):
-            candidate_data['phone'] = contact_info['phone']
-        
-        processing_time = time.time() - start_time
-        
-        return {
-            'analysis_success': extraction_success,
-            'resume_text': resume_text,
-            'extracted_skills': extracted_skills,
-            'extracted_experience': extracted_experience,
-            'extracted_education': extracted_education,
-            'contact_information': contact_info,
-            'document_structure': document_structure,
-            'sections': sections,
-            'processing_time_seconds': round(processing_time, 2)
-        }
-        
+        analysis_result = await loop.run_in_executor(_get_resume_pool(), _analyze_resume, file_path)
     except Exception as e:
         logger.error(f"Error processing resume {file_path}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Resume processing failed: {str(e)}")
+    
+    # candidate_data lives in this process, so fill it in here
+    _fill_missing_contact(candidate_data, analysis_result['contact_information'])
+    return analysis_result
 
 @router.post("/upload", response_model=ResumeAnalysisResult)
 async def upload_resume(
@@ -132,7 +219,7 @@ async def upload_resume(
     
     try:
         # Save uploaded file
-        file_path = save_uploaded_file(file)
+        file_path = await save_uploaded_file(file)
         
         # Prepare candidate data
         candidate_data = {
@@ -141,8 +228,8 @@ async def upload_resume(
             'phone': phone
         }
         
-        # Process resume
-        analysis_result = process_resume(file_path, candidate_data)
+        # Process resume (PDF parsing + NLP) in the worker pool
+        analysis_result = await process_resume_async(file_path, candidate_data)
         
         # Create candidate record
         candidate = Candidate(
@@ -186,38 +273,55 @@ async def upload_resume(
             os.remove(file_path)
         raise HTTPException(status_code=500, detail="Resume upload failed")
 
-@router.get("/candidates", response_model=List[CandidateSchema])
+# Serialized by hand below, so the schema is documented rather than enforced
+@router.get(
+    "/candidates",
+    response_model=None,
+    responses={200: {"model": List[CandidateSchema]}}
+)
 async def get_candidates(
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Union[AsyncSession, Session] = Depends(get_async_or_sync_db)
 ):
-    """Get list of candidates."""
-    candidates = db.query(Candidate).filter(
+    """Get list of candidates (without the full resume text)."""
+    # Select only the list-view columns as plain rows: the resume_text blob
+    # stays in the database and no ORM objects are built
+    stmt = select(
+        Candidate.id,
+        Candidate.name,
+        Candidate.email,
+        Candidate.phone,
+        Candidate.resume_filename,
+        Candidate.extracted_skills,
+        Candidate.extracted_experience,
+        Candidate.extracted_education,
+        Candidate.contact_information,
+        Candidate.created_at,
+        Candidate.updated_at
+    ).where(
         Candidate.created_by_id == current_user.id
-    ).offset(skip).limit(limit).all()
+    ).offset(skip).limit(limit)
+    
+    if isinstance(db, AsyncSession):
+        rows = (await db.execute(stmt)).mappings()
+    else:
+        rows = db.execute(stmt).mappings()
     
-    # Convert to schema format
     result = []
-    for candidate in candidates:
-        candidate_dict = {
-            'id': candidate.id,
-            'name': candidate.name,
-            'email': candidate.email,
-            'phone': candidate.phone,
-            'resume_filename': candidate.resume_filename,
-            'resume_text': candidate.resume_text,
-            'extracted_skills': candidate.get_extracted_skills(),
-            'extracted_experience': candidate.get_extracted_experience(),
-            'extracted_education': candidate.get_extracted_education(),
-            'contact_information': candidate.contact_information,
-            'created_at': candidate.created_at,
-            'updated_at': candidate.updated_at
-        }
+    for row in rows:
+        candidate_dict = dict(row)
+        for key in ('extracted_skills', 'extracted_experience', 'extracted_education'):
+            candidate_dict[key] = candidate_dict[key] or {}
         result.append(candidate_dict)
     
-    return result
+    # Trusted rows: serialize without building and re-validating a response
+    # model per row, through msgspec structs when available, else orjson
+    if CandidateListItem is not None:
+        content = LIST_JSON_ENCODER.encode([CandidateListItem(**row) for row in result])
+        return Response(content=content, media_type="application/json")
+    return ORJSONResponse(result)
 
 @router.get("/candidates/{candidate_id}", response_model=CandidateSchema)
 async def get_candidate(
@@ -234,20 +338,7 @@ async def get_candidate(
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    return {
-        'id': candidate.id,
-        'name': candidate.name,
-        'email': candidate.email,
-        'phone': candidate.phone,
-        'resume_filename': candidate.resume_filename,
-        'resume_text': candidate.resume_text,
-        'extracted_skills': candidate.get_extracted_skills(),
-        'extracted_experience': candidate.get_extracted_experience(),
-        'extracted_education': candidate.get_extracted_education(),
-        'contact_information': candidate.contact_information,
-        'created_at': candidate.created_at,
-        'updated_at': candidate.updated_at
-    }
+    return from_orm_fast(CandidateSchema, candidate)
 
 @router.put("/candidates/{candidate_id}", response_model=CandidateSchema)
 async def update_candidate(
@@ -273,20 +364,7 @@ async def update_candidate(
     db.commit()
     db.refresh(candidate)
     
-    return {
-        'id': candidate.id,
-        'name': candidate.name,
-        'email': candidate.email,
-        'phone': candidate.phone,
-        'resume_filename': candidate.resume_filename,
-        'resume_text': candidate.resume_text,
-        'extracted_skills': candidate.get_extracted_skills(),
-        'extracted_experience': candidate.get_extracted_experience(),
-        'extracted_education': candidate.get_extracted_education(),
-        'contact_information': candidate.contact_information,
-        'created_at': candidate.created_at,
-        'updated_at': candidate.updated_at
-    }
+    return from_orm_fast(CandidateSchema, candidate)
 
 @router.delete("/candidates/{candidate_id}", response_model=APIResponse)
 async def delete_candidate(
@@ -333,10 +411,11 @@ async def reprocess_resume(
         # Reprocess the existing resume text
         start_time = time.time()
         
-        # Perform NLP analysis on existing text
-        extracted_skills = nlp_analyzer.extract_skills(candidate.resume_text)
-        extracted_experience = nlp_analyzer.analyze_experience(candidate.resume_text)
-        extracted_education = nlp_analyzer.analyze_education(candidate.resume_text)
+        # Perform NLP analysis on existing text in the worker pool, off the event loop
+        loop = asyncio.get_running_loop()
+        extracted_skills, extracted_experience, extracted_education = await loop.run_in_executor(
+            _get_resume_pool(), _reanalyze_text, candidate.resume_text
+        )
         
         # Update candidate record
         candidate.set_extracted_skills(extracted_skills)
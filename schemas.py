@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from typing import List, Dict, Literal, Optional, Any, Type, TypeVar
 from datetime import datetime
 from enum import Enum
 
@@ -28,21 +28,34 @@ class InterviewSessionStatus(str, Enum):
     completed = "completed"
     expired = "expired"
 
+# Field types for the enums above. Literal validates as a plain membership
+# check, where an Enum field builds an enum member for every value.
+UserRoleValue = Literal["recruiter", "admin", "candidate"]
+AssessmentStatusValue = Literal["pending", "in_progress", "completed", "archived"]
+HiringRecommendationValue = Literal["strong_hire", "hire", "maybe", "no_hire", "manual_review"]
+InterviewSessionStatusValue = Literal["active", "paused", "completed", "expired"]
+
+# Base for every schema below: core schemas are built on first
+# validate/dump instead of at import, so cold start doesn't pay for
+# models a process never touches
+class _SchemaBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
 # User schemas
-class UserBase(BaseModel):
+class UserBase(_SchemaBase):
     email: EmailStr
     username: str = Field(..., min_length=3, max_length=50)
     full_name: Optional[str] = None
-    role: UserRole = UserRole.recruiter
+    role: UserRoleValue = "recruiter"
 
 class UserCreate(UserBase):
     password: str = Field(..., min_length=8)
 
-class UserUpdate(BaseModel):
+class UserUpdate(_SchemaBase):
     email: Optional[EmailStr] = None
     username: Optional[str] = None
     full_name: Optional[str] = None
-    role: Optional[UserRole] = None
+    role: Optional[UserRoleValue] = None
     is_active: Optional[bool] = None
 
 class User(UserBase):
@@ -55,15 +68,15 @@ class User(UserBase):
         from_attributes = True
 
 # Authentication schemas
-class Token(BaseModel):
+class Token(_SchemaBase):
     access_token: str
     token_type: str
 
-class TokenData(BaseModel):
+class TokenData(_SchemaBase):
     username: Optional[str] = None
 
 # Candidate schemas
-class CandidateBase(BaseModel):
+class CandidateBase(_SchemaBase):
     name: str = Field(..., min_length=2, max_length=100)
     email: EmailStr
     phone: Optional[str] = None
@@ -71,7 +84,7 @@ class CandidateBase(BaseModel):
 class CandidateCreate(CandidateBase):
     pass
 
-class CandidateUpdate(BaseModel):
+class CandidateUpdate(_SchemaBase):
     name: Optional[str] = None
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
@@ -87,11 +100,23 @@ class Candidate(CandidateBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    # Free-form Dict[str, Any] fields, no nested models: nothing to gain from
+    # revalidating nested instances
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra='ignore',
+        revalidate_instances='never'
+    )
 
 # Job Description schemas
-class JobDescriptionBase(BaseModel):
+_VALID_EMPLOYMENT_TYPES = frozenset({"full_time", "part_time", "contract", "intern"})
+
+def _check_employment_type(value: Optional[str]) -> Optional[str]:
+    if value is not None and value not in _VALID_EMPLOYMENT_TYPES:
+        raise ValueError(f"employment_type must be one of: {', '.join(sorted(_VALID_EMPLOYMENT_TYPES))}")
+    return value
+
+class JobDescriptionBase(_SchemaBase):
     title: str = Field(..., min_length=2, max_length=200)
     company: str = Field(..., min_length=2, max_length=100)
     description: str = Field(..., min_length=10)
@@ -103,8 +128,10 @@ class JobDescriptionBase(BaseModel):
 class JobDescriptionCreate(JobDescriptionBase):
     required_skills: Optional[List[str]] = []
     preferred_skills: Optional[List[str]] = []
+    
+    _validate_employment_type = field_validator('employment_type')(_check_employment_type)
 
-class JobDescriptionUpdate(BaseModel):
+class JobDescriptionUpdate(_SchemaBase):
     title: Optional[str] = None
     company: Optional[str] = None
     description: Optional[str] = None
@@ -115,6 +142,8 @@ class JobDescriptionUpdate(BaseModel):
     salary_range: Optional[str] = None
     employment_type: Optional[str] = None
     is_active: Optional[bool] = None
+    
+    _validate_employment_type = field_validator('employment_type')(_check_employment_type)
 
 class JobDescription(JobDescriptionBase):
     id: int
@@ -128,7 +157,7 @@ class JobDescription(JobDescriptionBase):
         from_attributes = True
 
 # Assessment schemas
-class AssessmentBase(BaseModel):
+class AssessmentBase(_SchemaBase):
     candidate_id: int
     job_description_id: int
     assessment_type: str = "comprehensive"
@@ -136,11 +165,11 @@ class AssessmentBase(BaseModel):
 class AssessmentCreate(AssessmentBase):
     pass
 
-class AssessmentUpdate(BaseModel):
-    status: Optional[AssessmentStatus] = None
+class AssessmentUpdate(_SchemaBase):
+    status: Optional[AssessmentStatusValue] = None
     overall_score: Optional[float] = None
     confidence_level: Optional[float] = None
-    hiring_recommendation: Optional[HiringRecommendation] = None
+    hiring_recommendation: Optional[HiringRecommendationValue] = None
 
 class Assessment(AssessmentBase):
     id: int
@@ -156,17 +185,28 @@ class Assessment(AssessmentBase):
     development_areas: Optional[List[str]] = None
     risk_factors: Optional[List[Dict[str, Any]]] = None
     recommendations: Optional[Dict[str, Any]] = None
-    status: AssessmentStatus
-    hiring_recommendation: Optional[HiringRecommendation] = None
+    status: AssessmentStatusValue
+    hiring_recommendation: Optional[HiringRecommendationValue] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    # Free-form Dict[str, Any] fields, no nested models: nothing to gain from
+    # revalidating nested instances
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra='ignore',
+        revalidate_instances='never'
+    )
 
 # Interview schemas
-class InterviewQuestion(BaseModel):
+# Per-question interview DTOs are immutable values: frozen makes them
+# hashable (dedupe, cache keys) and extra='forbid' rejects unknown fields
+_INTERVIEW_VALUE_CONFIG = ConfigDict(frozen=True, extra='forbid')
+
+class InterviewQuestion(_SchemaBase):
+    model_config = _INTERVIEW_VALUE_CONFIG
+    
     question: str
     category: str
     type: str
@@ -175,12 +215,16 @@ class InterviewQuestion(BaseModel):
     follow_up: Optional[str] = None
     question_number: Optional[int] = None
 
-class InterviewResponse(BaseModel):
+class InterviewResponse(_SchemaBase):
+    model_config = _INTERVIEW_VALUE_CONFIG
+    
     question_id: int
     response_text: str
     response_time_seconds: Optional[int] = None
 
-class InterviewEvaluation(BaseModel):
+class InterviewEvaluation(_SchemaBase):
+    model_config = _INTERVIEW_VALUE_CONFIG
+    
     question_id: int
     overall_score: float
     scores: Dict[str, float]
@@ -189,17 +233,21 @@ class InterviewEvaluation(BaseModel):
     feedback: str
     recommendation: str
 
-class InterviewSessionCreate(BaseModel):
+class InterviewClientMessage(_SchemaBase):
+    """Message sent by the client over the interview WebSocket."""
+    type: Optional[str] = None
+
+class InterviewSessionCreate(_SchemaBase):
     assessment_id: int
     num_questions: int = 10
 
-class InterviewSession(BaseModel):
+class InterviewSession(_SchemaBase):
     id: int
     assessment_id: int
     session_token: str
     current_question_index: int
     total_questions: int
-    status: InterviewSessionStatus
+    status: InterviewSessionStatusValue
     started_at: datetime
     completed_at: Optional[datetime] = None
     expires_at: datetime
@@ -208,10 +256,10 @@ class InterviewSession(BaseModel):
         from_attributes = True
 
 # Resume upload schemas
-class ResumeUpload(BaseModel):
+class ResumeUpload(_SchemaBase):
     candidate_data: CandidateCreate
 
-class ResumeAnalysisResult(BaseModel):
+class ResumeAnalysisResult(_SchemaBase):
     candidate_id: int
     analysis_success: bool
     extracted_skills: Dict[str, Any]
@@ -222,13 +270,13 @@ class ResumeAnalysisResult(BaseModel):
     processing_time_seconds: float
 
 # Report schemas
-class ReportRequest(BaseModel):
+class ReportRequest(_SchemaBase):
     assessment_id: int
     format: str = "pdf"  # pdf, html, json
     include_detailed_analysis: bool = True
     include_interview_responses: bool = True
 
-class ReportResponse(BaseModel):
+class ReportResponse(_SchemaBase):
     report_id: str
     assessment_id: int
     format: str
@@ -238,13 +286,13 @@ class ReportResponse(BaseModel):
     expires_at: Optional[datetime] = None
 
 # API Response schemas
-class APIResponse(BaseModel):
+class APIResponse(_SchemaBase):
     success: bool
     message: str
     data: Optional[Any] = None
     errors: Optional[List[str]] = None
 
-class PaginatedResponse(BaseModel):
+class PaginatedResponse(_SchemaBase):
     items: List[Any]
     total: int
     page: int
@@ -252,7 +300,7 @@ class PaginatedResponse(BaseModel):
     pages: int
 
 # Health check schema
-class HealthCheck(BaseModel):
+class HealthCheck(_SchemaBase):
     status: str
     service: str
     version: str
@@ -260,14 +308,50 @@ class HealthCheck(BaseModel):
 
 
 
-class FreeTrialUserCreate(BaseModel):
+class FreeTrialUserCreate(_SchemaBase):
     email: EmailStr
     full_name: str
     password: str = Field(..., min_length=8)
 
-class FreeTrialUserLogin(BaseModel):
+class FreeTrialUserLogin(_SchemaBase):
     email: EmailStr
     password: str
 
 
-
+# Fast ORM -> response DTO conversion
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def from_orm_fast(cls: Type[ModelT], obj: Any) -> ModelT:
+    """
+    Build a read-only response DTO from a trusted ORM row without running
+    validation; the database already enforces the column types. Use
+    model_validate for untrusted input (the *Create/*Update schemas).
+    """
+    return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+
+
+# Outbound list rows as msgspec structs: no validation on construction and
+# a C-level JSON encoder. Input still goes through the pydantic schemas.
+try:
+    import msgspec
+except ImportError:  # optional; list endpoints fall back to ORJSONResponse
+    msgspec = None
+
+if msgspec is not None:
+    class CandidateListItem(msgspec.Struct):
+        id: int
+        name: str
+        email: str
+        phone: Optional[str]
+        resume_filename: str
+        extracted_skills: Dict[str, Any]
+        extracted_experience: Dict[str, Any]
+        extracted_education: Dict[str, Any]
+        contact_information: Any
+        created_at: datetime
+        updated_at: Optional[datetime]
+    
+    LIST_JSON_ENCODER = msgspec.json.Encoder()
+else:
+    CandidateListItem = None
+    LIST_JSON_ENCODER = None
@@ -1,11 +1,118 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Index, ForeignKey, insert
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
-from passlib.context import CryptContext
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.ext.compiler import compiles
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+import bcrypt
+import hashlib
+import os
+import threading
+import time
 import re
 
+# Separate from app.models.database.Base: both declare "users" and
+# "assessments" tables (and User/Assessment classes) with different
+# columns, which a single MetaData and class registry cannot hold
 Base = declarative_base()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt only uses the first 72 bytes of a password; passlib truncated
+# silently, so keep doing that for existing hashes to keep verifying
+_BCRYPT_MAX_BYTES = 72
+
+# Work factor for free-trial accounts: short-lived, so 2^10 (OWASP minimum)
+# instead of bcrypt's default 2^12
+_TRIAL_BCRYPT_ROUNDS = 10
+
+# Successful free-trial verifications remembered for this long, so repeat
+# logins within a token-refresh window skip bcrypt
+_VERIFY_CACHE_TTL = 60
+_VERIFY_CACHE_SIZE = 1024
+_verify_cache = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+# Threads for batch hashing, started on first use; bcrypt releases the GIL
+# while hashing, so these run on all cores without pickling to a process
+_HASH_POOL_WORKERS = os.cpu_count() or 1
+_hash_pool: Optional[ThreadPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(
+                max_workers=_HASH_POOL_WORKERS,
+                thread_name_prefix="bcrypt"
+            )
+        return _hash_pool
+
+def _hash_password(password: str, rounds: int = 12) -> str:
+    return bcrypt.hashpw(password.encode()[:_BCRYPT_MAX_BYTES], bcrypt.gensalt(rounds)).decode()
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(password.encode()[:_BCRYPT_MAX_BYTES], hashed_password.encode())
+
+def _verify_password_cached(password: str, hashed_password: str) -> bool:
+    """
+    _verify_password with a short-lived in-process cache of successes. The
+    key holds the stored hash and a SHA-256 of the password, never the
+    password itself; a changed password has a new hash and so misses.
+    """
+    key = (hashed_password, hashlib.sha256(password.encode()).digest())
+    now = time.monotonic()
+    with _verify_cache_lock:
+        expires = _verify_cache.get(key)
+        if expires is not None:
+            if expires > now:
+                return True
+            del _verify_cache[key]
+    
+    if not _verify_password(password, hashed_password):
+        return False
+    
+    with _verify_cache_lock:
+        _verify_cache[key] = now + _VERIFY_CACHE_TTL
+        _verify_cache.move_to_end(key)
+        while len(_verify_cache) > _VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+    return True
+
+# Indian mobile number: 10 digits starting with 6-9
+_MOBILE_RE = re.compile(r'^[6-9]\d{9}$')
+
+# Allowed values for constrained string columns. @validates only fires on
+# assignment, so rows loaded with older values still read fine; statuses
+# match AssessmentStatusValue in schemas.py
+_VALID_ADMIN_ROLES = frozenset({"admin", "super_admin", "hr_manager"})
+_VALID_ASSESSMENT_STATUSES = frozenset({"pending", "in_progress", "completed", "archived"})
+
+# Native JSON column: JSONB on PostgreSQL, the dialect's JSON type elsewhere
+JSONColumn = JSON().with_variant(JSONB(), "postgresql")
+
+# Length of a free trial
+FREE_TRIAL_DURATION_HOURS = 1
+
+class _trial_end_default(FunctionElement):
+    """Server-side default for trial_end_time: now + the trial length."""
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+@compiles(_trial_end_default)
+def _compile_trial_end_default(element, compiler, **kw):
+    return f"CURRENT_TIMESTAMP + INTERVAL '{FREE_TRIAL_DURATION_HOURS}' HOUR"
+
+@compiles(_trial_end_default, "postgresql")
+def _compile_trial_end_default_pg(element, compiler, **kw):
+    return f"now() + interval '{FREE_TRIAL_DURATION_HOURS} hours'"
+
+@compiles(_trial_end_default, "sqlite")
+def _compile_trial_end_default_sqlite(element, compiler, **kw):
+    return f"datetime('now', '+{FREE_TRIAL_DURATION_HOURS} hours')"
 
 class User(Base):
     """Base user model with common fields"""
@@ -22,12 +129,17 @@ class User(Base):
     
     def verify_password(self, password: str) -> bool:
         """Verify password against hash"""
-        return pwd_context.verify(password, self.hashed_password)
+        return _verify_password(password, self.hashed_password)
     
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash password"""
-        return pwd_context.hash(password)
+        return _hash_password(password)
+    
+    @staticmethod
+    def hash_passwords(passwords: Iterable[str]) -> List[str]:
+        """Hash several passwords in parallel, in input order"""
+        return list(_get_hash_pool().map(_hash_password, passwords))
 
 class Student(Base):
     """Student-specific model"""
@@ -50,8 +162,7 @@ class Student(Base):
     def validate_mobile_number(mobile: str) -> bool:
         """Validate mobile number format"""
         # Basic validation for mobile number (10 digits)
-        pattern = r'^[6-9]\d{9}$'
-        return bool(re.match(pattern, mobile))
+        return _MOBILE_RE.match(mobile) is not None
 
 class Admin(Base):
     """Admin-specific model"""
@@ -62,18 +173,31 @@ class Admin(Base):
     full_name = Column(String(255), nullable=False)
     role = Column(String(50), default="admin")  # admin, super_admin, hr_manager
     department = Column(String(255), nullable=True)
-    permissions = Column(Text, nullable=True)  # JSON string of permissions
+    permissions = Column(JSONColumn, nullable=True)  # permissions
     last_login = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    @validates('role')
+    def validate_role(self, key, role):
+        """Reject roles outside the known set"""
+        if role not in _VALID_ADMIN_ROLES:
+            raise ValueError(f"Invalid admin role: {role}")
+        return role
 
 class Assessment(Base):
     """Assessment model linking students to their assessments"""
     __tablename__ = "assessments"
+    __table_args__ = (
+        # Dashboard lists filter by owner and status, newest first
+        Index("ix_assess_student_status", "student_id", "status"),
+        Index("ix_assess_admin_status", "admin_id", "status"),
+        Index("ix_assess_created", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, nullable=False)  # Foreign key to Student
-    admin_id = Column(Integer, nullable=False)  # Foreign key to Admin (who created)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    admin_id = Column(Integer, ForeignKey("admins.id"), nullable=False)  # who created it
     job_title = Column(String(255), nullable=False)
     company = Column(String(255), nullable=False)
     job_description = Column(Text, nullable=False)
@@ -82,50 +206,105 @@ class Assessment(Base):
     status = Column(String(50), default="pending")  # pending, in_progress, completed
     overall_score = Column(Integer, nullable=True)
     recommendation = Column(String(50), nullable=True)  # strong_hire, hire, maybe, no_hire
-    assessment_data = Column(Text, nullable=True)  # JSON string of detailed assessment
+    assessment_data = Column(JSONColumn, nullable=True)  # detailed assessment
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # lazy="raise": listings must eager-load these with selectinload(),
+    # so a loop over assessments can't issue one query per row
+    student = relationship("Student", lazy="raise")
+    admin = relationship("Admin", lazy="raise")
+    
+    @validates('status')
+    def validate_status(self, key, status):
+        """Reject statuses outside the known set"""
+        if status not in _VALID_ASSESSMENT_STATUSES:
+            raise ValueError(f"Invalid assessment status: {status}")
+        return status
+    
+    @classmethod
+    def bulk_create(cls, db, admin_id: int, student_ids: Iterable[int], job_title: str,
+                    company: str, job_description: str) -> List[int]:
+        """
+        Create one pending assessment per student with a single bulk
+        INSERT ... RETURNING instead of an add/flush per row, and return
+        the new ids in student order (sort_by_parameter_order makes
+        SQLAlchemy match returned rows to their parameter sets). Databases
+        without RETURNING fall back to a regular ORM flush. Does not commit.
+        """
+        rows = [
+            {
+                "student_id": student_id,
+                "admin_id": admin_id,
+                "job_title": job_title,
+                "company": company,
+                "job_description": job_description,
+                "status": "pending",
+            }
+            for student_id in student_ids
+        ]
+        if not rows:
+            return []
+        
+        if db.get_bind().dialect.insert_returning:
+            stmt = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+            return list(db.execute(stmt, rows).scalars())
+        
+        assessments = [cls(**row) for row in rows]
+        db.add_all(assessments)
+        db.flush()
+        return [assessment.id for assessment in assessments]
 
 class Interview(Base):
     """Interview session model"""
     __tablename__ = "interviews"
+    __table_args__ = (
+        Index("ix_interview_assess_status", "assessment_id", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    assessment_id = Column(Integer, nullable=False)  # Foreign key to Assessment
-    student_id = Column(Integer, nullable=False)  # Foreign key to Student
+    assessment_id = Column(Integer, ForeignKey("assessments.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
     status = Column(String(50), default="scheduled")  # scheduled, in_progress, completed
-    questions = Column(Text, nullable=True)  # JSON string of questions
-    responses = Column(Text, nullable=True)  # JSON string of responses
+    questions = Column(JSONColumn, nullable=True)  # questions
+    responses = Column(JSONColumn, nullable=True)  # responses
     duration_minutes = Column(Integer, nullable=True)
     score = Column(Integer, nullable=True)
     feedback = Column(Text, nullable=True)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Eager-load with selectinload(); see Assessment
+    assessment = relationship("Assessment", lazy="raise")
+    student = relationship("Student", lazy="raise")
 
 
 
 class FreeTrialUser(Base):
     """Free Trial User model"""
     __tablename__ = "free_trial_users"
+    __table_args__ = (
+        Index("ix_ft_email_active", "email", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
     full_name = Column(String(255), nullable=False)
     hashed_password = Column(String(255), nullable=False)
     trial_start_time = Column(DateTime(timezone=True), server_default=func.now())
-    trial_end_time = Column(DateTime(timezone=True), nullable=False)
+    trial_end_time = Column(DateTime(timezone=True), server_default=_trial_end_default(), nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     def verify_password(self, password: str) -> bool:
         """Verify password against hash"""
-        return pwd_context.verify(password, self.hashed_password)
+        return _verify_password_cached(password, self.hashed_password)
 
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash password"""
-        return pwd_context.hash(password)
+        return _hash_password(password, rounds=_TRIAL_BCRYPT_ROUNDS)
 
 